@@ -74,10 +74,10 @@ cpdef int loop(
         object pages,
         int output,
         object prng) except? -1:
-    cdef int num_events = 0, ev, user_idx, page_idx, i
+    cdef int num_events = 0, ev, user_idx, page_idx, i, num_edits
     cdef User user
     cdef Page page
-    cdef double r, aR, dR, R, T, o, ups, tt, num_edits
+    cdef double r, aR, dR, R, T, o, ups, tt
     cdef double t = tstart
     cdef double uR = args.daily_users
     cdef double pR = args.daily_pages
@@ -91,6 +91,10 @@ cpdef int loop(
     cdef object ppage = []
     cdef object editsqueue = []
     cdef cnp.ndarray[cnp.double_t, ndim=1] times
+    # the caller's lists, written back on exit so that population changes
+    # survive across transient/main legs and are visible to the caller
+    cdef object caller_users = users
+    cdef object caller_pages = pages
     aR = 0.0
     dR = 0.0
     users = [ toUser(u) for u in users ]
@@ -192,5 +196,7 @@ cpdef int loop(
                 ppage.append(page.edits)
         if args.info_file is not None:
             args.info_file.write('%g %g %g\n' % (t, len(users), len(pages)))
+    caller_users[:] = users
+    caller_pages[:] = pages
     return num_events
 
@@ -0,0 +1,80 @@
+#coding: utf-8
+''' C core of the maximin latin hypercube search. © 2010 Giovanni Luca Ciampaglia '''
+
+from __future__ import division
+import numpy as np
+
+cimport numpy as cnp
+cimport cython
+
+cdef extern from "float.h":
+    double DBL_MAX
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline double _min_sq_dist(cnp.ndarray[cnp.int32_t, ndim=2] d):
+    '''
+    minimum squared pairwise distance over the points (columns) of an (m, n)
+    design; the coordinates of each dimension are contiguous in memory
+    '''
+    cdef:
+        int m = d.shape[0], n = d.shape[1]
+        int i, j, k
+        double best = DBL_MAX, s, diff
+    for i in range(n):
+        for j in range(i):
+            s = 0.
+            for k in range(m):
+                diff = d[k, i] - d[k, j]
+                s += diff * diff
+            if s < best:
+                best = s
+    return best
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def maximin_lhd(int m, int n, int num, object prng):
+    '''
+    Generate num random LHDs of n points in m dimensions and return the one
+    attaining the maximum over the minimum pairwise distance between points.
+
+    Parameters
+    ----------
+    m    - number of dimensions
+    n    - number of points
+    num  - number of designs to try
+    prng - instance of numpy.random.RandomState
+
+    Returns
+    -------
+    mdist  - maximal minimum pairwise distance
+    design - (m, n) array of int32 grid indices
+    '''
+    cdef:
+        cnp.ndarray[cnp.int32_t, ndim=2] design = np.empty((m, n),
+                dtype=np.int32)
+        cnp.ndarray[cnp.int32_t, ndim=2] best_design = np.empty((m, n),
+                dtype=np.int32)
+        cnp.ndarray[cnp.float64_t, ndim=1] u
+        double best = -1., score
+        int b, i, j, k
+        cnp.int32_t tmp
+    if num <= 0:
+        raise ValueError('invalid number of designs: %s' % num)
+    for b in range(num):
+        # one bulk draw per design; the Fisher-Yates shuffles below consume
+        # n - 1 variates per column
+        u = prng.random_sample(m * (n - 1))
+        for k in range(m):
+            for i in range(n):
+                design[k, i] = i
+            for i in range(n - 1, 0, -1):
+                j = <int>(u[k * (n - 1) + (n - 1 - i)] * (i + 1))
+                tmp = design[k, i]
+                design[k, i] = design[k, j]
+                design[k, j] = tmp
+        score = _min_sq_dist(design)
+        if score > best:
+            best = score
+            best_design[:] = design
+    return np.sqrt(best), best_design
@@ -5,25 +5,161 @@
 
 ''' Latin Hypercube Designs. © 2010 Giovanni Luca Ciampaglia '''
 
-# TODO: implement a simulated annealing procedure for finding a maximin design
-# (see Morris, M. and Mitchell, T., 1995. Exploratory design for computer
-# experiments. J. Statist. Plann. Inference 43, pp. 381–402.) 
-
 import sys
 from argparse import ArgumentParser
+from multiprocessing import Process, Queue, cpu_count
 import numpy as np
-from scipy.spatial.distance import pdist
 
 from ..utils import AppendTupleAction
 
-def _map_to_range(lhd, gr):
-    lhd_idx = map(tuple, lhd)
-    res = []
-    for idx in lhd_idx:
-        res.append(tuple([ gr[i][k] for i,k in enumerate(idx) ]))
-    return np.asarray(res) + np.diff(gr[:,:2],axis=1).T/2
+try:
+    from . import _lhd_core
+except ImportError:
+    # extension module not built; fall back to the NumPy search
+    _lhd_core = None
+
+# number of designs generated and scored at a time in the maximin search
+_block = 64
+
+def _index_dtype(n):
+    ''' smallest signed integer dtype that can hold grid indices up to n '''
+    if n < 2 ** 7:
+        return np.int8
+    elif n < 2 ** 15:
+        return np.int16
+    return np.int32
+
+def _permutations(prng, n, m, num=None):
+    '''
+    batch of permutations in coordinates-by-dimension layout: an (m, n)
+    integer array of m independent permutations of range(n), or a
+    (num, m, n) stack thereof, stored in the smallest dtype that fits n.
+    One contiguous row per dimension gives unit-stride loads in the
+    distance kernels. Uses the batched Generator.permuted API when prng
+    provides it (NumPy >= 1.17), otherwise argsorts a single buffer of
+    uniform variates.
+    '''
+    shape = (m, n) if num is None else (num, m, n)
+    dtype = _index_dtype(n)
+    if hasattr(prng, 'permuted'):
+        arr = np.empty(shape, dtype=dtype)
+        arr[:] = np.arange(n, dtype=dtype)
+        prng.permuted(arr, axis=len(shape) - 1, out=arr)
+        return arr
+    return np.argsort(prng.random_sample(shape), axis=-1).astype(dtype)
+
+def min_sq_pdist(d):
+    '''
+    minimum squared pairwise distance between the points (columns) of a
+    single (m, n) design. Only the scalar minimum is computed; the full
+    n*(n-1)/2 distance vector of scipy.spatial.distance.pdist is never
+    materialized.
+    '''
+    d = np.asarray(d)
+    if d.dtype.kind != 'f':
+        # integer grid indices: float32 is exact here and halves the
+        # bandwidth through the distance kernel
+        d = d.astype(np.float32)
+    G = np.dot(d.T, d)
+    sq = np.diagonal(G)
+    d2 = sq[:, None] + sq[None, :] - 2 * G
+    n = d2.shape[0]
+    d2[np.arange(n), np.arange(n)] = np.inf
+    return d2.min().clip(0)
+
+def _sq_dists(designs):
+    '''
+    squared pairwise distances between the points (columns) of each design
+    in a (num, m, n) stack, computed via the
+    || x - y ||^2 = ||x||^2 - 2 x.y + ||y||^2 identity so that all designs
+    go through a single batched matrix product. The diagonal is set to +inf.
+    '''
+    designs = np.asarray(designs)
+    if designs.dtype.kind != 'f':
+        designs = designs.astype(np.float32)
+    G = np.einsum('bki,bkj->bij', designs, designs)
+    sq = np.diagonal(G, axis1=1, axis2=2)
+    d2 = sq[:, :, None] + sq[:, None, :] - 2 * G
+    n = d2.shape[1]
+    d2[:, np.arange(n), np.arange(n)] = np.inf
+    return d2
+
+def _min_pdist(designs):
+    ''' minimum pairwise distance of each design in a (num, m, n) stack '''
+    return np.sqrt(_sq_dists(designs).min(axis=(1, 2)).clip(0))
+
+def _phi_p(designs, p):
+    '''
+    negated phi_p criterion of Morris & Mitchell for each design in a
+    (num, m, n) stack. For large p the design maximizing this criterion is
+    asymptotically the maximin design, but the sum reduction is smooth and
+    vectorizes better than the minimum.
+    '''
+    d2 = _sq_dists(designs)
+    # the +inf diagonal contributes nothing to the sum. The power is taken in
+    # double precision: float32 underflows already for p = 50 and d2 > 34
+    return -(d2.astype(np.double) ** (-p / 2.)).sum(axis=(1, 2))
 
-def lhd(m, n, num=None, ranges=None, prng=np.random, maximin=False):
+def _sa_search(m, n, num, gr, half, prng):
+    '''
+    simulated annealing search for a maximin LHD (see Morris, M. and
+    Mitchell, T., 1995. Exploratory design for computer experiments.
+    J. Statist. Plann. Inference 43, pp. 381-402). Starting from a random
+    design, performs num swap moves of two entries within one column; a swap
+    only touches two points, so only the two affected rows/columns of the
+    cached squared-distance matrix are recomputed per move.
+    '''
+    design = _permutations(prng, n, m)
+    if gr is not None:
+        x = _map_to_range(design, gr, half)
+    else:
+        x = design.astype(np.float32)
+    d2 = _sq_dists(x[None])[0]
+    curr = d2.min()
+    # geometric cooling from the scale of the initial score down to ~1% of it
+    t0, tf = curr, curr / 100.
+    for step in range(num):
+        c = prng.randint(m)
+        i, j = prng.randint(n), prng.randint(n - 1)
+        if j >= i:
+            j += 1
+        design[c, i], design[c, j] = design[c, j], design[c, i]
+        x[c, i], x[c, j] = x[c, j], x[c, i]
+        old_i, old_j = d2[i].copy(), d2[j].copy()
+        for r in (i, j):
+            d2[r] = ((x[:, r:r + 1] - x) ** 2).sum(axis=0)
+            d2[r, r] = np.inf
+            d2[:, r] = d2[r]
+        new = d2.min()
+        t = t0 * (tf / t0) ** (step / float(num))
+        if new >= curr or prng.random_sample() < np.exp((new - curr) / t):
+            curr = new
+        else:
+            # revert the move
+            design[c, i], design[c, j] = design[c, j], design[c, i]
+            x[c, i], x[c, j] = x[c, j], x[c, i]
+            d2[i], d2[:, i] = old_i, old_i
+            d2[j], d2[:, j] = old_j, old_j
+    if gr is not None:
+        return np.sqrt(curr), x
+    return np.sqrt(curr), design
+
+def _map_to_range(lhd, gr, half):
+    coords = gr[np.arange(gr.shape[0])[:, None], lhd]
+    return coords + half[:, None]
+
+def _maximin_worker(queue, m, n, share, ranges, criterion, p, search, seed):
+    '''
+    one worker of the parallel maximin search: runs the same search on its
+    own share of the candidate budget with a deterministically seeded
+    stream. Module-level so it stays picklable under the spawn start method.
+    '''
+    wprng = np.random.RandomState(seed)
+    queue.put(lhd(m, n, num=share, ranges=ranges, prng=wprng, maximin=True,
+        criterion=criterion, p=p, search=search))
+
+def lhd(m, n, num=None, ranges=None, prng=np.random, maximin=False,
+        criterion='maximin', p=50, search='random', nprocs=1):
     """
     latin hypercube design in m dimensions.
 
@@ -42,6 +178,22 @@ def lhd(m, n, num=None, ranges=None, prng=np.random, maximin=False):
     prng - instance of numpy.random.RandomState (default = numpy.random)
     maximin - boolean
         if True, returns the design that attains the maximum of mdist
+    criterion - 'maximin' or 'phi_p'
+        scoring function used to rank designs when maximin is True. The
+        default ranks by minimum pairwise distance; 'phi_p' ranks by the
+        (negated) phi_p criterion of Morris & Mitchell, which approximates
+        maximin for large p with a smooth sum reduction
+    p - scalar int
+        exponent of the phi_p criterion (ignored unless criterion='phi_p')
+    search - 'random' or 'sa'
+        maximin search strategy: best of num independent random designs
+        (default), or a simulated annealing walk of num swap moves from a
+        single random design, which typically gets much closer to the
+        optimum for the same budget
+    nprocs - scalar int or None
+        number of worker processes for the maximin search; the candidate
+        budget is split evenly and each worker is seeded deterministically
+        from prng. None means one worker per CPU. Default: 1 (serial)
 
     Returns
     -------
@@ -56,46 +208,94 @@ def lhd(m, n, num=None, ranges=None, prng=np.random, maximin=False):
     If a list of interval bounds is passed, then their midpoints are returned
     instead. Multiple designs, together with the corresponding values of the
     pairwise minimum distance are returned if num is not None. The list may
-    contain duplicate. 
+    contain duplicate.
+
+    All distance computations run on squared euclidean distances (the sqrt
+    is taken once on the reported scalar), so no scipy.spatial pdist call
+    is involved.
 
     Examples
     --------
     >>> prng = np.random.RandomState(0)
     >>> x, y = np.mgrid[0:1:5j, 0:1:5j]
     >>> d, design = lhd(2,5, prng=prng)
-    >>> print d
-    1.41421356237
-    >>> idx = map(tuple, design)    # list of indices for each grid
-    >>> x[idx[0]], y[idx[0]]        # coordinates of the first center
-    (0.5, 0.0)
+    >>> print(d)
+    1.4142135
+    >>> idx = list(zip(*design))    # index tuple of each center
+    >>> float(x[idx[0]]), float(y[idx[0]]) # coordinates of the first center
+    (1.0, 1.0)
     """
     if ranges is not None and len(ranges) != m:
         raise ValueError('expecting %d ranges' % m)
+    if criterion not in ('maximin', 'phi_p'):
+        raise ValueError('unknown criterion: %s' % criterion)
+    if search not in ('random', 'sa'):
+        raise ValueError('unknown search: %s' % search)
     if ranges is not None:
-       gr = np.asarray([ np.linspace(a,b,n,endpoint=False) for (a,b) in
-           ranges])
+        gr = np.asarray([ np.linspace(a,b,n,endpoint=False) for (a,b) in
+            ranges], dtype=np.float32)
+        # grid half-step, constant across designs
+        half = (gr[:, 1] - gr[:, 0]) / 2
     else:
         gr = None
     if num is None:
-        lhd = np.asarray([ prng.permutation(n) for i in xrange(m) ]).T
+        # a single argsort over an (n, m) buffer of uniform variates yields m
+        # independent permutations at once, without m Python-level RNG calls
+        design = _permutations(prng, n, m)
         if gr is not None:
-            lhd = _map_to_range(lhd, gr)
-        return pdist(lhd).min(), lhd
+            design = _map_to_range(design, gr, half)
+        return np.sqrt(min_sq_pdist(design)), design
+    elif maximin:
+        if nprocs is None:
+            nprocs = cpu_count()
+        if nprocs > 1:
+            # split the candidate budget across workers (see _maximin_worker)
+            nprocs = min(nprocs, num)
+            shares = [ num // nprocs + (1 if i < num % nprocs else 0)
+                    for i in range(nprocs) ]
+            seeds = prng.randint(0, 2 ** 32 - 1, nprocs)
+            queue = Queue()
+            pool = [ Process(target=_maximin_worker, args=(queue, m, n,
+                shares[i], ranges, criterion, p, search, seeds[i]))
+                for i in range(nprocs) ]
+            for proc in pool:
+                proc.start()
+            results = [ queue.get() for i in range(nprocs) ]
+            for proc in pool:
+                proc.join()
+            return max(results, key=lambda r: r[0])
+        if search == 'sa':
+            return _sa_search(m, n, num, gr, half if gr is not None else None,
+                    prng)
+        if gr is None and criterion == 'maximin' and _lhd_core is not None:
+            # tight generate-score-select loop entirely in C
+            return _lhd_core.maximin_lhd(m, n, num, prng)
+        # generate and score designs in fixed-size blocks, keeping only the
+        # running best: the full (num, n, m) stack is never materialized
+        max_d, max_design = -np.inf, None
+        for start in range(0, num, _block):
+            b = min(_block, num - start)
+            designs = _permutations(prng, n, m, b)
+            if gr is not None:
+                designs = np.asarray([ _map_to_range(d, gr, half) for d in designs ])
+            if criterion == 'phi_p':
+                score = _phi_p(designs, p)
+            else:
+                # sqrt is monotonic, so candidates are compared on squared
+                # distances and only the winner is rooted below
+                score = _sq_dists(designs).min(axis=(1, 2))
+            j = score.argmax()
+            if score[j] > max_d:
+                max_d = score[j]
+                max_design = designs[j]
+        if criterion == 'maximin':
+            max_d = np.sqrt(max_d.clip(0))
+        return max_d, max_design
     else:
-        lhd_iter = ( np.asarray([ prng.permutation(n) for i in xrange(m) ]).T
-                for j in xrange(num) )
+        designs = _permutations(prng, n, m, num)
         if gr is not None:
-            lhd_iter = ( _map_to_range(d, gr) for d in lhd_iter )
-        lhd_iter = ( (pdist(d).min(), d) for d in lhd_iter )
-        if maximin:
-            max_d, max_design = -1, None
-            for d, design in lhd_iter:
-                if d > max_d:
-                    max_d = d
-                    max_design = design
-            return max_d, max_design
-        else:
-            return list(lhd_iter)
+            designs = np.asarray([ _map_to_range(d, gr, half) for d in designs ])
+        return zip(_min_pdist(designs), designs)
 
 def make_parser():
     parser = ArgumentParser(description='Latin hypercube sampling')
@@ -151,7 +351,7 @@ def make_parser():
 
 def repeat(n, pointsiter):
     for point in pointsiter:
-        for i in xrange(n):
+        for i in range(n):
             yield point
 
 def main(args):
@@ -159,17 +359,15 @@ def main(args):
     args.maximin = (args.maximin_num is not None)
     dist, design = lhd(args.dimension, args.num, num=args.maximin_num, 
             ranges=args.intervals, maximin=args.maximin, prng=prng)
-    for p in repeat(args.repeat, design):
-        print args.separator.join(map(str,p))
+    for p in repeat(args.repeat, design.T):
+        print(args.separator.join(map(str,p)))
 
 if __name__ == '__main__':
     parser = make_parser()
     ns = parser.parse_args()
     try:
         main(ns)
-    except:
-        ty, val, tb = sys.exc_info()
+    except Exception as e:
         if ns.debug:
-            raise ty, val, tb
-        else:
-            parser.error('%s : %s' % (ty.__name__, val))
+            raise
+        parser.error('%s : %s' % (type(e).__name__, e))
@@ -1,18 +1,23 @@
 ''' Fits mixture of truncated univariate normals to data using EM '''
 
+from __future__ import print_function
+
 from argparse import ArgumentParser
+from collections import namedtuple
 import numpy as np
-from scipy.stats import kstest, norm
-from scipy.stats.distributions import _norm_pdf 
-from scipy.special import ndtr as norm_cdf 
+from scipy.stats import norm
+from scipy.special import ndtr as norm_cdf, ndtri, logsumexp
 from scipy.cluster.vq import kmeans2
+from scipy.optimize import minimize
 import sys
 import os.path 
 from warnings import warn
 import matplotlib.pyplot as pp
 from matplotlib import cm
 from datetime import timedelta
-from multiprocessing import Pool, Array
+from multiprocessing import Pool, Array, Value, cpu_count
+from multiprocessing.pool import ThreadPool
+import threading
 import signal
 
 from ..utils import sanetext, fmt
@@ -20,163 +25,391 @@ from ..rand import randwpmf
 from ..graphics import mixturehist
 from .ctruncated import EM as cEM
 
-# On Mac OS X inf**2 raises OverflowError.  This is normal. See here:
-# http://bugs.python.org/issue3222
+_norm_pdf_C = np.sqrt(2 * np.pi)
+
+def norm_pdf(x):
+    # x * x is safe on infinities, unlike the ** operator that raises
+    # OverflowError on Mac OS X (http://bugs.python.org/issue3222), and
+    # exp(-inf) is exactly 0, so no platform guard is needed
+    return np.exp(-x * x / 2.) / _norm_pdf_C
+
+TruncStats = namedtuple('TruncStats', 'l u phi_l phi_u Phi_l Phi_u Z')
+
+def _trunc_stats(mu, sigma, bound):
+    ''' standardized bounds and the normal pdf/cdf evaluated there. The
+    helpers below all need some of these values; computing them once per
+    (mu, sigma, bound) and passing the result around avoids re-evaluating
+    ndtr on the same points several times per EM step. Works elementwise, so
+    mu and sigma may be (k,) arrays. '''
+    l = (bound[0] - mu) / sigma
+    u = (bound[1] - mu) / sigma
+    Phi_l = norm_cdf(l)
+    Phi_u = norm_cdf(u)
+    return TruncStats(l, u, norm_pdf(l), norm_pdf(u), Phi_l, Phi_u,
+            Phi_u - Phi_l)
+
+def _stats_item(stats, i):
+    ''' the scalar stats of component i out of array-valued stats '''
+    return TruncStats(*[ f[i] for f in stats ])
+
+def _tnorm_pdf_unchecked(x, mu, sigma, bound, stats=None):
+    ''' truncated normal density without the support mask, for callers whose
+    data is already clipped to the bounds (EM does this on entry) '''
+    if stats is None:
+        stats = _trunc_stats(mu, sigma, bound)
+    z = (np.asarray(x) - mu) / sigma
+    # normalize in place: no temporary beyond the output buffer
+    d = norm_pdf(z)
+    d /= stats.Z * sigma
+    return d
 
-if sys.platform == 'darwin':
-    def norm_pdf(x):
-        return np.where(np.isinf(x), 0, _norm_pdf(x))
-else:
-    norm_pdf = _norm_pdf
- 
-def tnorm_pdf(x, mu, sigma, bound):
+def tnorm_pdf(x, mu, sigma, bound, stats=None):
     ''' truncated normal density function '''
+    if stats is None:
+        stats = _trunc_stats(mu, sigma, bound)
+    z = (np.asarray(x) - mu) / sigma
+    d = norm_pdf(z)
+    d /= stats.Z * sigma
+    # branchless masking: multiplying by the boolean support tests zeroes the
+    # out-of-range entries without the extra output array of np.where
+    d *= z >= stats.l
+    d *= z <= stats.u
+    return d
+
+def tnorm_cdf(x, mu, sigma, bound, stats=None):
+    ''' truncated normal distribution function '''
+    if stats is None:
+        stats = _trunc_stats(mu, sigma, bound)
+    z = (np.asarray(x) - mu) / sigma
+    p = norm_cdf(z)
+    p -= stats.Phi_l
+    p /= stats.Z
+    p[z < stats.l] = 0
+    p[z > stats.u] = 1
+    return p
+
+def tnorm_mixture_pdf(x, weights, mu, sigma, bound):
+    ''' density of a mixture of truncated normals. weights, mu and sigma are
+    (k,) arrays; all components are evaluated in one broadcast pass over x '''
     x = np.asarray(x)
-    x = (x - mu) / sigma
+    shape = x.shape
+    mu = np.asarray(mu)[:, np.newaxis]
+    sigma = np.asarray(sigma)[:, np.newaxis]
+    z = (x.ravel() - mu) / sigma # (k, n)
     u = (bound[1] - mu) / sigma
     l = (bound[0] - mu) / sigma
     c = norm_cdf(u) - norm_cdf(l)
-    d = norm_pdf(x) / (c * sigma)
-    return np.where((x >= l) & (x <= u), d, 0.)
+    d = norm_pdf(z)
+    d /= c * sigma
+    d *= np.asarray(weights)[:, np.newaxis]
+    d[(z < l) | (z > u)] = 0.
+    return d.sum(axis=0).reshape(shape)
 
-def tnorm_cdf(x, mu, sigma, bound):
-    ''' truncated normal distribution function '''
+def tnorm_mixture_cdf(x, weights, mu, sigma, bound):
+    ''' distribution function of a mixture of truncated normals, evaluated
+    like tnorm_mixture_pdf in one broadcast pass '''
     x = np.asarray(x)
-    x = (x - mu) / sigma
+    shape = x.shape
+    mu = np.asarray(mu)[:, np.newaxis]
+    sigma = np.asarray(sigma)[:, np.newaxis]
+    z = (x.ravel() - mu) / sigma # (k, n)
     u = (bound[1] - mu) / sigma
     l = (bound[0] - mu) / sigma
-    c = norm_cdf(u) - norm_cdf(l)
-    p = (norm_cdf(x) - norm_cdf(l)) / c
-    p[x < l] = 0
-    p[x > u] = 1
-    return p
-#    return np.where((x >= l) & (x <= u), p, 0.)
+    cl = norm_cdf(l)
+    c = norm_cdf(u) - cl
+    p = norm_cdf(z)
+    p -= cl
+    p /= c
+    p[z < l] = 0.
+    p[z > u] = 1.
+    p *= np.asarray(weights)[:, np.newaxis]
+    return p.sum(axis=0).reshape(shape)
+
+def tnorm_logpdf(x, mu, sigma, bound, stats=None):
+    ''' log-density of the truncated normal, computed directly so that points
+    far from mu do not underflow '''
+    if stats is None:
+        stats = _trunc_stats(mu, sigma, bound)
+    z = (np.asarray(x) - mu) / sigma
+    d = z * z
+    d /= -2.
+    d -= np.log(stats.Z * sigma * _norm_pdf_C)
+    return np.where((z >= stats.l) & (z <= stats.u), d, -np.inf)
 
-def _loglike(data, weights, mu, sigma, bound):
+def _ks_stat(data, weights, mu, sigma, bound):
+    ''' two-sided K-S statistic of data against the mixture CDF, computed in
+    one vectorized pass over the sorted sample instead of going through the
+    scipy.stats.kstest callback interface '''
+    x = np.sort(np.ravel(data))
+    n = len(x)
+    F = tnorm_mixture_cdf(x, weights, mu, sigma, bound)
+    ecdf = np.arange(1., n + 1) / n
+    return max(np.abs(ecdf - F).max(), np.abs(ecdf - 1. / n - F).max())
+
+def _loglike(data, weights, mu, sigma, bound, tmp=None, stats=None):
+    ''' log-likelihood of the sample via logsumexp over component log
+    densities. tmp, if given, is a reusable (k, n) scratch buffer; stats is an
+    optional array-valued result of _trunc_stats for (mu, sigma, bound) '''
     n = len(data)
     k = len(weights)
-    tmp = np.zeros((k, n))
-    for i in xrange(k):
-        tmp[i] = weights[i] * tnorm_pdf(data, mu[i], sigma[i], bound) 
-    return np.sum(np.log(np.sum(tmp,axis=0)))
+    if tmp is None:
+        tmp = np.empty((k, n))
+    if stats is None:
+        stats = _trunc_stats(np.asarray(mu), np.asarray(sigma), bound)
+    for i in range(k):
+        tmp[i] = tnorm_logpdf(data, mu[i], sigma[i], bound,
+                stats=_stats_item(stats, i))
+        tmp[i] += np.log(weights[i])
+    return np.sum(logsumexp(tmp, axis=0))
 
-def _responsibilities(data, weights, mu, sigma, bound):
-    ''' the E-step of the algorithm '''
+def _responsibilities(data, weights, mu, sigma, bound, out=None, stats=None):
+    ''' the E-step of the algorithm. If out is given, it must be an (n, k)
+    buffer that receives the responsibilities; it is reused across iterations
+    to avoid reallocating k densities per step. stats is an optional
+    array-valued result of _trunc_stats for (mu, sigma, bound) '''
     n = len(data)
     k = len(weights)
-    g = np.zeros((k, n))
-    for i in xrange(k):
-        g[i] = tnorm_pdf(data,mu[i],sigma[i],bound) * weights[i]
-    g = g.T / g.sum(axis=0)[:,np.newaxis]
-    return g
-
-def _tmeancost(mu, sigma, bound):
-    ''' additive constant for the mean of the truncated normal '''
-    l, u = bound
-    l = (l - mu) / sigma
-    u = (u - mu) / sigma
-    n = norm_pdf(u) - norm_pdf(l)
-    d = norm_cdf(u) - norm_cdf(l)
-    c = sigma * n / d
+    if out is None:
+        out = np.empty((n, k))
+    if stats is None:
+        stats = _trunc_stats(np.asarray(mu), np.asarray(sigma), bound)
+    for i in range(k):
+        out[:, i] = _tnorm_pdf_unchecked(data, mu[i], sigma[i], bound,
+                stats=_stats_item(stats, i))
+        out[:, i] *= weights[i]
+    # normalize rows in place; no transposed copy
+    out /= out.sum(axis=1)[:, np.newaxis]
+    return out
+
+def _tmeancost(mu, sigma, bound, stats=None):
+    ''' additive constant for the mean of the truncated normal. mu and sigma
+    may be arrays of shape (k,); the costs for all components are computed in
+    one call '''
+    sigma = np.asarray(sigma)
+    if stats is None:
+        stats = _trunc_stats(np.asarray(mu), sigma, bound)
+    c = sigma * (stats.phi_u - stats.phi_l) / stats.Z
     return c
 
-def _tvarcost(mu, sigma, bound):
-    ''' multiplicative factor for the variance of the truncated normal '''
-    l,u = bound
-    l = (l - mu) / sigma
-    u = (u - mu) / sigma
+def _tvarcost(mu, sigma, bound, stats=None):
+    ''' multiplicative factor for the variance of the truncated normal. mu and
+    sigma may be arrays of shape (k,) '''
+    if stats is None:
+        stats = _trunc_stats(np.asarray(mu), np.asarray(sigma), bound)
+    l, u = stats.l, stats.u
     # as x --> +/- Inf, x * f(x) --> 0 for the gaussian density f, but 0. *
     # Inf would normally give NaN
-    n1_1 = 0. if np.isinf(u) else u * norm_pdf(u) 
-    n1_2 = 0. if np.isinf(l) else l * norm_pdf(l) 
+    # replace infinities before the product: norm_pdf(+/-inf) is 0, so the
+    # masked entries come out 0 without ever forming inf * 0
+    n1_1 = np.where(np.isinf(u), 0., u) * stats.phi_u
+    n1_2 = np.where(np.isinf(l), 0., l) * stats.phi_l
     n1 = n1_1 - n1_2
-    n2 = norm_pdf(u) - norm_pdf(l)
-    d = norm_cdf(u) - norm_cdf(l)
-    c = 1 + n1 / d - (n2 /d )**2 
-    assert c > 0, "c = %g " % c
+    n2 = stats.phi_u - stats.phi_l
+    d = stats.Z
+    c = 1 + n1 / d - (n2 / d) ** 2
+    assert np.all(c > 0), "c = %s " % c
     return c
 
-def _maximize(data, mu, sigma, bound, gamma):
+def _maximize(data, mu, sigma, bound, gamma, mu_out=None, sigma_out=None,
+        stats=None):
     ''' the M-step of the algorithm. Moments estimates are for the non-truncated
-    normal. '''
+    normal. mu_out/sigma_out, if given, receive the new estimates; they must
+    not alias mu/sigma, which are read for the truncation corrections. stats
+    is an optional array-valued result of _trunc_stats for (mu, sigma,
+    bound) '''
     n = len(data)
-    k = len(mu)
-    mu1 = np.zeros((k,))
-    sigma1 = np.zeros((k,))
-    w1 = gamma.sum(axis=0) / float(n)
-    for i in xrange(k):
-        muc = _tmeancost(mu[i],sigma[i],bound)
-        varc = _tvarcost(mu[i],sigma[i],bound)
-        mu1[i] = np.sum(data * gamma[:,i]) / gamma[:,i].sum() 
-        sigma1[i] = np.sqrt( np.sum((data - mu1[i])**2 * gamma[:,i])\
-                / gamma[:,i].sum())  
-        mu1[i] -= muc
-        sigma1[i] /= np.sqrt(varc)
-    return w1, mu1, sigma1
+    if mu_out is None:
+        mu_out = np.empty(len(mu))
+    if sigma_out is None:
+        sigma_out = np.empty(len(sigma))
+    gamma_sum = gamma.sum(axis=0)
+    w1 = gamma_sum / float(n)
+    # weighted first and second moments as matrix-vector products: two passes
+    # over data instead of 2k
+    np.dot(data, gamma, out=mu_out)
+    mu_out /= gamma_sum
+    np.dot(data * data, gamma, out=sigma_out)
+    sigma_out /= gamma_sum
+    sigma_out -= mu_out ** 2
+    np.sqrt(sigma_out, sigma_out)
+    mu_out -= _tmeancost(mu, sigma, bound, stats=stats)
+    sigma_out /= np.sqrt(_tvarcost(mu, sigma, bound, stats=stats))
+    return w1, mu_out, sigma_out
 
 def _init_EM(data, k, prng=np.random):
     ''' initializes with hard assignments to clusters using kmeans '''
-    # ensurers deterministic result of kmeans2
-    seed = prng.randint(0, sys.maxint)
+    # ensurers deterministic result of kmeans2. NB: seeds must fit in 32 bits
+    seed = prng.randint(0, 2 ** 32 - 1)
     np.random.seed(seed)
-    flag = True
     n = float(len(data))
-    while flag:
+    while True:
         mu, assign = kmeans2(data, k, iter=5, minit='random')
-        sigma = []
-        weights = []
-        for i in xrange(k):
-            idx = (assign == i)
-            sigma.append(np.std(data[idx], ddof=1))
-            weights.append(np.sum(idx) / n)
-        sigma = np.asarray(sigma)
-        weights = np.asarray(weights)
-        flag = True - np.all(weights > 0)
+        counts = np.bincount(assign, minlength=k)
+        # each cluster needs at least two points for the ddof=1 variance
+        if np.all(counts > 1):
+            break
+    # per-cluster weight, mean and variance in one pass over the assignments
+    sums = np.bincount(assign, weights=data, minlength=k)
+    sq = np.bincount(assign, weights=data * data, minlength=k)
+    weights = counts / n
+    var = (sq / counts - (sums / counts) ** 2) * (counts / (counts - 1.))
+    sigma = np.sqrt(var)
     return weights, mu, sigma
 
-def EM(data, k, bounds=None, n_iter=100, thresh=1e-2, verbose=False, 
-        prng=np.random):
+_start_iter = 5 # EM burn-in iterations per restart in _beststart
+
+def _startworker(args):
+    ''' one restart: kmeans initialization plus a short EM burn-in; returns
+    the burnt-in parameters with their log-likelihood '''
+    data, k, bounds, seed = args
+    prng = np.random.RandomState(seed)
+    weights, mu, sigma = _init_EM(data, k, prng)
+    for i in range(_start_iter):
+        gamma = _responsibilities(data, weights, mu, sigma, bounds)
+        weights, mu, sigma = _maximize(data, mu, sigma, bounds, gamma)
+    return _loglike(data, weights, mu, sigma, bounds), weights, mu, sigma
+
+def _beststart(data, k, bounds, n_starts, prng=np.random, nprocs=None):
+    ''' multi-start initialization: runs n_starts restarts in parallel and
+    returns the parameters that reached the best log-likelihood '''
+    if nprocs is None:
+        nprocs = cpu_count()
+    seeds = prng.randint(0, 2 ** 32 - 1, n_starts)
+    pool = Pool(min(nprocs, n_starts))
+    try:
+        results = pool.map(_startworker,
+                [ (data, k, bounds, s) for s in seeds ])
+    finally:
+        pool.terminate()
+        pool.join()
+    best = max(results, key=lambda r: r[0])
+    return best[1], best[2], best[3]
+
+def EM(data, k, bounds=None, n_iter=100, thresh=1e-2, verbose=False,
+        prng=np.random, n_starts=1, nprocs=None):
     '''
-    Fit a truncated GMM to data using the EM algorithm. 
-    
+    Fit a truncated GMM to data using the EM algorithm.
+
     Parameters
     ----------
     data    - array (will be truncated within bounds)
     k       - number of components to fit
-    bounds  - default: (data.min(), data.max()) 
+    bounds  - default: (data.min(), data.max())
     n_iter  - maximum number of iterations
     thresh  - stop iteration when marginal increment in loglike is below thresh
     verbose - if True, print log-likelihood and prior probabilities
     prng    - instance of numpy.random.RandomState
-    
+    n_starts - if greater than 1, run this many short restarts in parallel
+              and continue from the one with the best log-likelihood
+    nprocs  - number of worker processes for the restarts (default: all cores)
+
     Returns
     -------
     weights, mu, sigma - GMM parameters
     loglike            - the sequence of log-likelihood values
     flag               - True if convergence happened within maxiter
-    ''' 
+    '''
     data = np.ravel(data)
     if bounds is not None:
         l, u = bounds
         data = data[(data >= l) & (data <= u)]
     else:
         bounds = (np.min(data), np.max(data))
-    weights, mu, sigma = _init_EM(data, k, prng)
+    if n_starts > 1:
+        weights, mu, sigma = _beststart(data, k, bounds, n_starts, prng,
+                nprocs)
+    else:
+        weights, mu, sigma = _init_EM(data, k, prng)
     loglike = np.zeros((n_iter,))
-    loglike[0] = _loglike(data, weights, mu, sigma, bounds)
+    # scratch buffers, allocated once and reused across iterations
+    n = len(data)
+    gamma = np.empty((n, k))
+    tmp = np.empty((k, n))
+    mu1 = np.empty(k)
+    sigma1 = np.empty(k)
+    loglike[0] = _loglike(data, weights, mu, sigma, bounds, tmp=tmp)
     if verbose:
-        print "0) LogLike = %g, Priors = %s" % (loglike[0], weights)
-    for i in xrange(1, n_iter):
-        gamma = _responsibilities(data, weights, mu, sigma, bounds)
-        weights, mu, sigma = _maximize(data, mu, sigma, bounds, gamma)
-        loglike[i] = _loglike(data, weights, mu, sigma, bounds) 
+        print("0) LogLike = %g, Priors = %s" % (loglike[0], weights))
+    for i in range(1, n_iter):
+        # E and M step read the same parameters: evaluate the truncation
+        # stats once and share them
+        stats = _trunc_stats(mu, sigma, bounds)
+        _responsibilities(data, weights, mu, sigma, bounds, out=gamma,
+                stats=stats)
+        weights, _, _ = _maximize(data, mu, sigma, bounds, gamma, mu_out=mu1,
+                sigma_out=sigma1, stats=stats)
+        # double-buffer: the old parameter arrays become next step's scratch
+        mu, mu1 = mu1, mu
+        sigma, sigma1 = sigma1, sigma
+        loglike[i] = _loglike(data, weights, mu, sigma, bounds, tmp=tmp)
         if verbose:
-            print "%d) LogLike = %g, Priors = %s" % (i, loglike[i], weights)
+            print("%d) LogLike = %g, Priors = %s" % (i, loglike[i], weights))
         flag = np.abs(loglike[i - 1] - loglike[i]) < thresh
         if flag:
             break
     return (weights, mu, sigma, np.trim_zeros(loglike), flag)
 
+def _nll_and_grad(theta, data, k, bound):
+    '''
+    negative log-likelihood of the mixture and its gradient, both computed in
+    one pass over the data. theta stacks (eta, mu, log sigma), with the
+    weights parameterized as a softmax of eta and sigma by its logarithm so
+    that the problem is unconstrained.
+    '''
+    eta = theta[:k]
+    mu = theta[k:2 * k]
+    sigma = np.exp(theta[2 * k:])
+    logw = eta - logsumexp(eta)
+    w = np.exp(logw)
+    stats = _trunc_stats(mu, sigma, bound)
+    z = (data - mu[:, np.newaxis]) / sigma[:, np.newaxis]
+    logp = z * z
+    logp /= -2.
+    logp += (logw - np.log(stats.Z * sigma * _norm_pdf_C))[:, np.newaxis]
+    m = logsumexp(logp, axis=0)
+    g = np.exp(logp - m) # responsibilities, (k, n)
+    G = g.sum(axis=1)
+    n = len(data)
+    # d log f / d mu and d log f / d log sigma of the truncated normal; the
+    # infinities are masked as in _tvarcost
+    up = np.where(np.isinf(stats.u), 0., stats.u) * stats.phi_u
+    lp = np.where(np.isinf(stats.l), 0., stats.l) * stats.phi_l
+    grad_eta = n * w - G
+    grad_mu = -((g * z).sum(axis=1) + G * (stats.phi_u - stats.phi_l)
+            / stats.Z) / sigma
+    grad_logsigma = -((g * z * z).sum(axis=1) - G + G * (up - lp) / stats.Z)
+    return -m.sum(), np.concatenate((grad_eta, grad_mu, grad_logsigma))
+
+def EM_lbfgs(data, k, bounds=None, n_iter=100, thresh=1e-2, verbose=False,
+        prng=np.random, n_starts=1, nprocs=None):
+    '''
+    Fit a truncated GMM by direct maximization of the log-likelihood with
+    L-BFGS-B and the analytic gradient, instead of EM fixed-point iterations.
+    Takes and returns the same arguments as EM, so the two are
+    interchangeable; thresh is interpreted as the tolerance on the objective.
+    '''
+    data = np.ravel(data)
+    if bounds is not None:
+        l, u = bounds
+        data = data[(data >= l) & (data <= u)]
+    else:
+        bounds = (np.min(data), np.max(data))
+    if n_starts > 1:
+        weights, mu, sigma = _beststart(data, k, bounds, n_starts, prng,
+                nprocs)
+    else:
+        weights, mu, sigma = _init_EM(data, k, prng)
+    theta0 = np.concatenate((np.log(weights), mu, np.log(sigma)))
+    res = minimize(_nll_and_grad, theta0, args=(data, k, bounds), jac=True,
+            method='L-BFGS-B', options=dict(maxiter=n_iter, ftol=thresh))
+    eta = res.x[:k]
+    weights = np.exp(eta - logsumexp(eta))
+    mu = res.x[k:2 * k]
+    sigma = np.exp(res.x[2 * k:])
+    if verbose:
+        print("%d) LogLike = %g, Priors = %s" % (res.nit, -res.fun, weights))
+    return (weights, mu, sigma, np.asarray([-res.fun]), bool(res.success))
+
 class TGMM(object):
     ''' 
     truncated gaussian mixture model. Supports univariate distributions only. 
@@ -229,15 +462,18 @@ class TGMM(object):
         if np.any(covars <= 0):
             raise ValueError('covars must be positive')
         self._covars = covars.copy()
+        # cached: pdf/cdf/rvs all need the standard deviations
+        self._sigma = np.sqrt(self._covars)
     covars = property(_get_covars, _set_covars)
-    def fit(self, data, **kwargs):
-        ''' 
-        fits TGMM to data using the EM algorithm. Additional keyword arguments
-        are passed to EM.
+    def fit(self, data, method='em', **kwargs):
+        '''
+        fits TGMM to data. method is either 'em' (the default, using the fast
+        Cython EM implementation) or 'lbfgs' (direct likelihood maximization,
+        see EM_lbfgs). Additional keyword arguments are passed on.
         '''
-        # using fast Cython implementation by default
-        weights, means, sigmas, ll, flag = cEM(data, self.components, self.bounds, 
-                **kwargs)
+        fitfunc = EM_lbfgs if method == 'lbfgs' else cEM
+        weights, means, sigmas, ll, flag = fitfunc(data, self.components,
+                self.bounds, **kwargs)
         self.weights = weights
         self.means = means
         self.covars = sigmas ** 2
@@ -247,15 +483,13 @@ class TGMM(object):
             warn('EM did not converge (no. iterations = %d' % len(ll), 
                     category=UserWarning)
     def pdf(self, data):
-        b = self.bounds
-        return np.sum([ w * tnorm_pdf(data, m, s, b) for w, m, s in \
-                zip(self.weights, self.means, np.sqrt(self.covars)) ], axis=0)
+        return tnorm_mixture_pdf(data, self.weights, self.means,
+                self._sigma, self.bounds)
     def cdf(self, data):
-        b = self.bounds
-        return np.sum([ w * tnorm_cdf(data, m, s, b) for w, m, s in \
-                zip(self.weights, self.means, np.sqrt(self.covars)) ], axis=0)
+        return tnorm_mixture_cdf(data, self.weights, self.means,
+                self._sigma, self.bounds)
     def rvs(self, size, prng=np.random):
-        ''' uses ancestor and rejection sampling 
+        ''' uses ancestor and inverse-CDF sampling
         size - shape paramenter
         '''
         if np.isscalar(size):
@@ -263,26 +497,20 @@ class TGMM(object):
         num = np.prod(size)
         z = randwpmf(self.weights, num, prng=prng)
         rvs = np.empty(num)
-        for i in xrange(self.components):
+        for i in range(self.components):
             idx = z == i
             n = np.sum(idx)
             if n == 0:
                 continue
             l, u = self.bounds
             m = self.means[i]
-            s = np.sqrt(self.covars[i])
+            s = self._sigma[i]
             l = (l - m) / s
             u = (u - m) / s
-            flag = True
-            samples = []
-            while n > 0:
-                x = prng.randn(n)
-                x = x[(x >= l) & (x <= u)]
-                n -= len(x)
-                if len(x):
-                    samples.append(x)
-            samples = np.hstack(samples)
-            rvs[idx] = samples * s + m
+            # map uniform draws through the inverse normal CDF: exactly n
+            # samples regardless of how heavy the truncation is
+            x = ndtri(prng.uniform(norm_cdf(l), norm_cdf(u), size=n))
+            rvs[idx] = x * s + m
         return rvs.reshape(size)
     def identify(self):
         '''
@@ -313,7 +541,8 @@ class TGMM(object):
         except AttributeError:
             raise ValueError('Cannot simulate confidence intervals on unfitted model')
         data = np.ravel(data)
-        x = _bootstrap(data, _errworker, sample, (self.components,))
+        x = _bootstrap(data, _errworker, sample,
+                (self.components, self.bounds))
         alpha = norm.ppf(1 - (1 - level) / 2.0) # two-tailed percentile
         err = np.std(x, ddof=1) / np.sqrt(len(x))
         self.ci = tuple(alpha * np.std(x, ddof=1, axis=0))
@@ -343,50 +572,101 @@ class TGMM(object):
         except AttributeError:
             raise ValueError('Cannot test unfitted model')
         data = np.ravel(data)
-        self.ks, _ = kstest(data, self.cdf)
-        self.ks_sample = _bootstrap(data, _ksworker, sample, (self.components,))
-        self.ks_pval = np.sum(self.D_sample >= D)/float(sample)
+        self.ks = _ks_stat(data, self.weights, self.means,
+                self._sigma, self.bounds)
+        self.ks_sample = _bootstrap(data, _ksworker, sample,
+                (self.components, self.bounds))
+        self.ks_pval = np.mean(np.asarray(self.ks_sample) >= self.ks)
         return self.ks, self.ks_pval
 
-def _bootstrap(data, target, sample, args=(), nprocs=None):
+def _bootstrap(data, target, sample, args=(), nprocs=None, threads=False):
     '''
     target is called as target(*args) and may declare a global variable data which
-    is a shared array holding the data
+    is a shared array holding the data. Replicates are dispatched to the pool
+    in one chunk per worker, so the task/result round-trip is paid nprocs
+    times rather than once per replicate.
+
+    With threads=True the replicates run on a thread pool sharing the data
+    array in-process, with one sample buffer per thread and no forking or
+    IPC at all. This only pays off when the fit releases the GIL, so process
+    workers remain the default.
     '''
-    shdata = Array('d', len(data))
-    shdata[:] = data
-    pool = Pool(nprocs, _initworker, (shdata,))
+    if nprocs is None:
+        nprocs = cpu_count()
+    if threads:
+        _setdata(np.ravel(np.asarray(data, dtype=np.double)))
+        pool = ThreadPool(nprocs)
+    else:
+        shdata = Array('d', len(data))
+        shdata[:] = data
+        seed = Value('L', np.random.randint(0, 2 ** 32 - 1))
+        pool = Pool(nprocs, _initworker, (shdata, seed))
+    chunks = [ sample // nprocs + (i < sample % nprocs)
+            for i in range(nprocs) ]
     try:
-        results = [ pool.apply_async(target, args) for i in xrange(sample) ]
-        return [ r.get() for r in results ]
+        results = [ pool.apply_async(_chunkworker, (target, n) + args)
+                for n in chunks if n > 0 ]
+        out = []
+        for r in results:
+            out.extend(r.get())
+        return out
     except KeyboardInterrupt:
-        print >> sys.stderr, "killing workers"
+        print("killing workers", file=sys.stderr)
         raise
     finally:
         pool.terminate()
         pool.join()
 
-def _initworker(shdata):
+def _chunkworker(target, n, *args):
+    ''' runs n bootstrap replicates of target in this worker '''
+    return [ target(*args) for i in range(n) ]
+
+def _setdata(arr):
+    ''' publishes the data array read by the bootstrap workers '''
     global data
+    data = arr
+
+_local = threading.local()
+
+def _initworker(shdata, seed):
     signal.signal(signal.SIGINT, signal.SIG_IGN)
-    data = shdata
+    # reseed the global stream: forked workers inherit the parent's
+    # RandomState, so without this every worker would draw the exact same
+    # bootstrap resamples. The shared counter hands each worker its own seed
+    with seed.get_lock():
+        s = seed.value
+        seed.value = (s + 1) % (2 ** 32)
+    np.random.seed(s)
+    # ndarray view on the shared buffer: np.asarray on the raw Array walks it
+    # element by element
+    _setdata(np.frombuffer(shdata.get_obj()))
 
 def _getsample():
+    ''' bootstrap resample of the shared data, gathered into a per-thread
+    buffer that is reused across replicates; callers must be done with it
+    before drawing again '''
     global data
-    _data = np.asarray(data)
-    idx = np.random.randint(0, len(data), len(data))
-    return _data[idx]
+    n = len(data)
+    try:
+        buf = _local.samplebuf
+    except AttributeError:
+        buf = _local.samplebuf = np.empty(n)
+    idx = np.random.randint(0, n, n)
+    np.take(data, idx, out=buf)
+    return buf
 
-def _ksworker(components):
+def _ksworker(components, bounds):
+    # share the bounds of the fitted model: inferring them from the resample
+    # would shift the quantiles of each replicate
     sample = _getsample()
-    tgmm = TGMM(components)
+    tgmm = TGMM(components, bounds=bounds)
     tgmm.fit(sample)
-    D, p = kstest(sample.ravel(), tgmm.cdf)
-    return D
+    return _ks_stat(sample, tgmm.weights, tgmm.means, tgmm._sigma,
+            tgmm.bounds)
 
-def _errworker(components):
+def _errworker(components, bounds):
     sample = _getsample()
-    tgmm = TGMM(components)
+    tgmm = TGMM(components, bounds=bounds)
     tgmm.fit(sample)
     tgmm.identify()
     return tgmm.means, tgmm.covars, tgmm.weights
@@ -454,11 +734,11 @@ def main(args):
     else:
         weights, means, sigmas, ll, flag = cEM(data, args.components, 
                 n_iter=args.iterations, prng=prng, verbose=args.verbose)
-    print
+    print()
     for i, comp in enumerate(zip(weights, means, sigmas)):
-        print 'Component %d:' % (i + 1)
-        print '---------------'
-        print 'prob. = %g, mean = %g, st.dev = %g' % comp
+        print('Component %d:' % (i + 1))
+        print('---------------')
+        print('prob. = %g, mean = %g, st.dev = %g' % comp)
         w, m, c = comp
         c *= c
         lnmean = timedelta(days=np.exp(m + c / 2))
@@ -466,18 +746,18 @@ def main(args):
         lnmod = timedelta(days=np.exp(m - c))
         lnvar = (np.exp(c) - 1) * np.exp(2 * m + c)
         lnerr = timedelta(days=np.sqrt(lnvar))
-        print "(Lognorm) mean = %s (1 s.d. = %s)" % (lnmean, lnerr)
-        print "(Lognorm) median = %s, mode = %s" % (lnmed, lnmod)
-        print 
-    print 'Data points: %d' % len(data)
-    print 'Log-Likelihood: %g' % ll[-1]
-    print 'Minimum value: %s' % timedelta(days=np.exp(data.min()))
-    print 'Maximum value: %s' % timedelta(days=np.exp(data.max()))
-    print
+        print("(Lognorm) mean = %s (1 s.d. = %s)" % (lnmean, lnerr))
+        print("(Lognorm) median = %s, mode = %s" % (lnmed, lnmod))
+        print()
+    print('Data points: %d' % len(data))
+    print('Log-Likelihood: %g' % ll[-1])
+    print('Minimum value: %s' % timedelta(days=np.exp(data.min())))
+    print('Maximum value: %s' % timedelta(days=np.exp(data.max())))
+    print()
     if flag:
-        print 'EM converged in %d iterations.' % len(ll)
+        print('EM converged in %d iterations.' % len(ll))
     else:
-        print 'EM did NOT converge! Try more iterations.'
+        print('EM did NOT converge! Try more iterations.')
     if args.plot:
         tgmm = TGMM(args.components, (np.min(data), np.max(data)))
         tgmm.weights = weights
@@ -495,7 +775,7 @@ if __name__ == '__main__':
         runctx('ret = main(ns)', globals=globals(), locals=locals(),
                 filename=ns.prof_file)
         Stats(ns.prof_file).strip_dirs().sort_stats("time").print_stats()
-        print 'profiling data saved in %s' % ns.prof_file
+        print('profiling data saved in %s' % ns.prof_file)
     else:
         ret = main(ns)
 
@@ -2,17 +2,40 @@
 Computes sensitivity indices as standardized linear regression coefficients.
 '''
 
+from __future__ import print_function
+
+import os.path
 from argparse import ArgumentParser, FileType
 import numpy as np
-import scikits.statsmodels as sm
+try:
+    import statsmodels.api as sm
+except ImportError:
+    import scikits.statsmodels as sm
 import matplotlib.pyplot as pp
 
 # TODO <Tue Feb  1 14:57:12 CET 2011> add scatter plots of residuals and
 # predicted values to check to homoscedasticity. Multicollinearity is not a
 # problem due to the experimental design. Plot histograms of residuals?
 
+def _loaddata(args):
+    '''
+    loads the data matrix. With --cache, a binary .npy copy is written next to
+    the input the first time and loaded on later runs, skipping the text
+    parsing entirely.
+    '''
+    fn = getattr(args.input, 'name', '')
+    if args.cache and os.path.exists(fn):
+        cachefn = fn + '.npy'
+        if os.path.exists(cachefn)\
+                and os.path.getmtime(cachefn) >= os.path.getmtime(fn):
+            return np.load(cachefn)
+        data = np.loadtxt(args.input, delimiter=args.sep, dtype=np.float64)
+        np.save(cachefn, data)
+        return data
+    return np.loadtxt(args.input, delimiter=args.sep, dtype=np.float64)
+
 def main(args):
-    data = np.loadtxt(args.input, delimiter=args.sep)
+    data = _loaddata(args)
     if args.params_file is not None:
         args.params = args.params_file.readline().strip().split(',')
     else:
@@ -25,10 +48,17 @@ def main(args):
         x = data[:,:-1]
         y = data[:,-1]
         ye = None
-    x = (x - x.mean(axis=0))/x.std(axis=0)
-    y = (y - y.mean())/y.std()
-    res = sm.GLS(y, x).fit()
-    print res.summary(xname=args.params)
+    # standardize in place: data is not used afterwards, so no copies needed
+    x -= x.mean(axis=0)
+    x /= x.std(axis=0)
+    y -= y.mean()
+    y /= y.std()
+    if ye is not None:
+        # weighted least squares with the measurement standard errors
+        res = sm.WLS(y, x, weights=1.0 / (ye * ye)).fit()
+    else:
+        res = sm.OLS(y, x).fit()
+    print(res.summary(xname=args.params))
 
 def make_parser():
     parser = ArgumentParser(description='Computes sensitivity indices using '\
@@ -43,6 +73,8 @@ def make_parser():
             '%(metavar)s (default: "%(default)s)"')
     parser.add_argument('-e','--with-error', action='store_true', help='if TRUE'\
             ', interprete last field as measurement standard errors')
+    parser.add_argument('-c', '--cache', action='store_true', help='cache a '\
+            'binary copy of the input next to it and reuse it on later runs')
     return parser
 
 if __name__ == '__main__':
@@ -1,33 +1,97 @@
-''' wrappers to numpy.lib.io.load and NpzFile '''
+''' wrappers to numpy.load and NpzFile '''
 
 import numpy as np
-from numpy.lib.io import NpzFile, load as _load, savez
-from itertools import izip, groupby
+from numpy import load as _load
+from numpy.lib.npyio import NpzFile
 from warnings import warn
-from cStringIO import StringIO
 
 __all__ = [ 'load', 'SimulationsFile', 'arrayfile' ]
 
+# os.posix_fadvise only exists on python 3, so go through libc; advice is
+# best-effort and _fadvise degrades to a no-op when the call is unavailable
+try:
+    from ctypes import CDLL, c_int, c_long
+    from ctypes.util import find_library
+    _libc = CDLL(find_library('c') or 'libc.so.6', use_errno=True)
+    _posix_fadvise = _libc.posix_fadvise
+    _posix_fadvise.argtypes = [ c_int, c_long, c_long, c_int ]
+except (ImportError, OSError, AttributeError):
+    _posix_fadvise = None
+
+_POSIX_FADV_SEQUENTIAL = 2
+_POSIX_FADV_WILLNEED = 3
+
+def _fadvise(fileobj, offset, length, advice):
+    ''' advises the kernel about the expected access pattern on the given
+    byte range; silently does nothing if unsupported '''
+    if _posix_fadvise is None:
+        return
+    try:
+        fd = fileobj.fileno()
+    except (AttributeError, IOError, OSError, ValueError):
+        return # not a real file
+    _posix_fadvise(fd, offset, length, advice)
+
 def load(file, mmap_mode='r'):
     ''' 
-    if numpy.lib.io.load returns an NpzFile then use the ZIP file's name and
+    if numpy.load returns an NpzFile then use the ZIP file's name and
     open a SimulationsFile from it. Else return a NumPy load's result.
     '''
     res = _load(file, mmap_mode=mmap_mode)
     if isinstance(res, NpzFile):
         return SimulationsFile(res.zip.fp.name)
+    if isinstance(res, np.memmap):
+        # simulation consumers scan these arrays front to back, so kick off
+        # an asynchronous readahead of the whole file. The memmap does not
+        # keep a file descriptor around (and mmap has no madvise on python
+        # 2), hence the short-lived advisory fd
+        try:
+            fileobj = file if hasattr(file, 'fileno') else open(file, 'rb')
+        except (IOError, OSError):
+            return res
+        _fadvise(fileobj, 0, 0, _POSIX_FADV_WILLNEED)
+        if fileobj is not file:
+            fileobj.close()
     return res
 
 def save(file, name, index, defaults, simulations):
     '''
     saves simulation data
     '''
+    import io
+    import zipfile
+    from numpy.lib import format
     arcdict = {}
     arcdict['%s_index' % name] = index
     arcdict['%s_defaults' % name] = defaults
     arcdict.update([ ('%s-%d' % (name,i), data) for i, data\
             in enumerate(simulations) ])
-    savez(file, **arcdict)
+    # write the archive ourselves instead of through savez: members stay
+    # uncompressed (which the memmap reader expects), zip64 is allowed for
+    # archives over 4 GiB, pickling is refused, writes go through one large
+    # buffer and the biggest arrays first so bulk writes dominate
+    if hasattr(file, 'write'):
+        fp, closefp = file, False
+    else:
+        if not file.endswith('.npz'):
+            file += '.npz' # like savez
+        fp = io.open(file, 'wb', buffering=4 << 20)
+        closefp = True
+    try:
+        zf = zipfile.ZipFile(fp, 'w', zipfile.ZIP_STORED, True)
+        try:
+            items = sorted(arcdict.items(), reverse=True,
+                    key=lambda kv: np.asanyarray(kv[1]).nbytes)
+            for key, arr in items:
+                sio = io.BytesIO()
+                format.write_array(sio, np.asanyarray(arr),
+                        allow_pickle=False)
+                zf.writestr(key + '.npy', sio.getvalue())
+        finally:
+            zf.close()
+    finally:
+        if closefp:
+            fp.close()
 
 class SimulationsFile(NpzFile):
     '''
@@ -54,31 +118,117 @@ class SimulationsFile(NpzFile):
             self.miss_defaults = 0
         if  len(self) != len(self.index):
             raise ValueError('index/data mismatch')
+        # member names in archive order, formatted once
+        self._item_keys = [ '%s-%d' % (self.name, i)
+                for i in range(len(self)) ]
+        # members are read in archive order: widen the kernel readahead
+        # window on the zip descriptor, which stays open with the instance
+        _fadvise(self.zip.fp, 0, 0, _POSIX_FADV_SEQUENTIAL)
     def __len__(self):
         return len(self.files) - 2 + self.miss_defaults
+    def __getitem__(self, key):
+        '''
+        Memory-maps stored (uncompressed) members instead of decompressing a
+        full in-memory copy, so arrays that are only scanned once never get
+        materialized. Falls back on the regular NpzFile read for compressed
+        members or file-like archives without a name.
+        '''
+        import struct
+        import zipfile
+        from numpy.lib import format
+        try:
+            info = self.zip.getinfo(key + '.npy')
+            mm = self._mmap()
+        except (KeyError, AttributeError, EnvironmentError, ValueError):
+            return super(SimulationsFile, self).__getitem__(key)
+        if info.compress_type != zipfile.ZIP_STORED:
+            return super(SimulationsFile, self).__getitem__(key)
+        # the extra field of the local header may differ from the central
+        # directory's, so read its actual lengths to find the data start
+        fp = self.zip.fp
+        fp.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack('<HH', fp.read(4))
+        fp.seek(info.header_offset + 30 + name_len + extra_len)
+        format.read_magic(fp)
+        shape, fortran, dtype = format.read_array_header_1_0(fp)
+        if dtype.hasobject:
+            return super(SimulationsFile, self).__getitem__(key)
+        return np.ndarray(shape, dtype=dtype, buffer=mm, offset=fp.tell(),
+                order='F' if fortran else 'C')
+    def _mmap(self):
+        '''
+        one read-only mmap over the whole archive, created on first use and
+        shared by all members: repeated accesses cost pure view arithmetic,
+        not an open/mmap syscall pair each. The views keep it referenced, so
+        it is released by the gc once the last of them dies.
+        '''
+        try:
+            return self._mm
+        except AttributeError:
+            import mmap
+            self._mm = mmap.mmap(self.zip.fp.fileno(), 0,
+                    access=mmap.ACCESS_READ)
+            return self._mm
     def __iter__(self):
-        for i in xrange(len(self)):
-            yield self[self.name+'-%d' % i]
+        for key in self._item_keys:
+            yield self[key]
     @property
     def index(self):
-        return self[self.name + '_index']
+        # cached: each NpzFile access seeks and decompresses a ZIP member
+        try:
+            return self._index
+        except AttributeError:
+            self._index = self[self.name + '_index']
+            return self._index
     @property
     def indexset(self):
-        # NOTE assumes that the index is sorted, otherwise zip(a.indexset,
-        # a.itergrouped()) won't match
-        raw_index = set(map(tuple, self.index))
-        return np.asarray(sorted(raw_index), dtype=self.index.dtype)
+        # np.unique sorts rows lexicographically, like sorted() on tuples
+        # did; itergrouped yields groups in the same order, so
+        # zip(a.indexset, a.itergrouped()) always matches
+        try:
+            return self._indexset
+        except AttributeError:
+            self._indexset = np.unique(self.index, axis=0)
+            return self._indexset
     @property
     def defaults(self):
         try:
-            return self[self.name + '_defaults']
-        except KeyError:
-            return []
+            return self._defaults
+        except AttributeError:
+            try:
+                self._defaults = self[self.name + '_defaults']
+            except KeyError:
+                self._defaults = []
+            return self._defaults
     def itergrouped(self):
-        keyfunc = lambda k : tuple(k[0])
-        zipiter = izip(self.index, iter(self))
-        for k, subiter in groupby(zipiter, keyfunc):
-            yield [data for k, data in subiter ]
+        # groups are yielded in lexicographic index order, matching indexset
+        # (see the note there). The stable lexsort is the identity on the
+        # usual already-sorted index, and the run boundaries are then found
+        # in C instead of calling a Python key function on every row
+        index = np.asarray(self.index)
+        if len(index) == 0:
+            return
+        order = np.lexsort(index.T[::-1])
+        index = index[order]
+        changed = np.flatnonzero((index[1:] != index[:-1]).any(axis=1)) + 1
+        bounds = np.concatenate(([0], changed, [len(index)]))
+        for g in range(len(bounds) - 1):
+            # members are memory-mapped views (see __getitem__), so ask the
+            # kernel to start fetching the next group while the caller is
+            # still busy with the current one
+            if g + 2 < len(bounds):
+                for i in range(bounds[g + 1], bounds[g + 2]):
+                    self._prefetch(self._item_keys[order[i]])
+            yield [ self[self._item_keys[order[i]]]
+                    for i in range(bounds[g], bounds[g + 1]) ]
+    def _prefetch(self, key):
+        ''' hints the kernel that the given member is about to be read '''
+        try:
+            info = self.zip.getinfo(key + '.npy')
+        except KeyError:
+            return
+        _fadvise(self.zip.fp, info.header_offset, info.compress_size + 4096,
+                _POSIX_FADV_WILLNEED)
 
 def arrayfile(data_file, shape, descr, fortran=False):
     ''' 
@@ -91,19 +241,17 @@ def arrayfile(data_file, shape, descr, fortran=False):
     descr - any argument that numpy.dtype() can take
     fortran - if True, the array uses Fortran data order, otherwise C order
     '''
-    from numpy.lib.io import format
-    header = { 
-        'descr' : descr, 
-        'fortran_order' : fortran, 
+    from numpy.lib import format
+    header = {
+        'descr' : descr,
+        'fortran_order' : fortran,
         'shape' : shape
         }
-    preamble = '\x93NUMPY\x01\x00'
-    data_file.write(preamble)
-    cio = StringIO()
-    format.write_array_header_1_0(cio, header) # write header here first
-    format.write_array_header_1_0(data_file, header) # write header
-    cio.seek(0) 
-    offset = len(preamble) + len(cio.readline()) # get offset 
+    # write_array_header_1_0 emits the magic preamble itself and leaves the
+    # file positioned at the start of the data, so the offset can be read off
+    # the file instead of serializing the header a second time to measure it
+    format.write_array_header_1_0(data_file, header)
+    offset = data_file.tell()
     return np.memmap(data_file, dtype=np.dtype(descr), mode='w+', shape=shape,
             offset=offset)
 
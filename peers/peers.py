@@ -11,14 +11,15 @@ from argparse import ArgumentParser, FileType
 import numpy as np
 import sys
 from time import time
-from cStringIO import StringIO
-from warnings import warn
-from heapq import heappop, heappush
-from collections import deque
+from warnings import warn, catch_warnings, simplefilter
 
 from .rand import randwpmf
-from .utils import ttysize, IncIDMixin, NNAction
-from .cpeers import loop as c_loop
+from .utils import ttysize, IncIDMixin, NNAction, FenwickCDF
+
+try:
+    from .cpeers import loop as c_loop
+except ImportError: # extension not built, fall back on the python loop
+    c_loop = None
 
 class User(IncIDMixin):
     ''' Class for user instances '''
@@ -52,6 +53,335 @@ class Page(IncIDMixin):
         self.opinion = opinion
         self.edits = edits
 
+class _InfoBuffer(object):
+    '''
+    Buffers the (time, users, pages) rows written with --info and flushes
+    them in bulk, replacing one string formatting and write call per event
+    with a single savetxt call per few thousand events.
+    '''
+    size = 8192
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.buf = np.empty((self.size, 3))
+        self.i = 0
+    def write(self, t, nusers, npages):
+        i = self.i
+        self.buf[i, 0] = t
+        self.buf[i, 1] = nusers
+        self.buf[i, 2] = npages
+        self.i = i + 1
+        if self.i == self.size:
+            self.flush()
+    def flush(self):
+        if self.i:
+            np.savetxt(self.fileobj, self.buf[:self.i], fmt='%g')
+            self.i = 0
+
+class _RNGCache(object):
+    '''
+    Serves uniform and shifted-exponential variates from preallocated
+    batches, so the generator crosses the Python/C boundary once per few
+    thousand draws instead of once per event and the log of the inter-event
+    times is computed by a vectorized ufunc at refill time.
+    '''
+    size = 1 << 14
+    def __init__(self, prng):
+        self.prng = prng
+        self._refill_u()
+        self._refill_exp()
+    def _refill_u(self):
+        # handing out python floats from a list skips the numpy scalar
+        # machinery on every draw
+        self._u = self.prng.rand(self.size).tolist()
+        self._iu = 0
+    def _refill_exp(self):
+        # 1 - log(1 - U): same law as 1 - log(U) on (0, 1) but safe against
+        # U == 0, which rand can return
+        self._exp = (1 - np.log(1 - self.prng.rand(self.size))).tolist()
+        self._ie = 0
+    def next_u(self):
+        ''' a uniform variate on [0, 1) '''
+        i = self._iu
+        if i == self.size:
+            self._refill_u()
+            i = 0
+        self._iu = i + 1
+        return self._u[i]
+    def next_exp(self):
+        ''' a 1 + Exp(1) variate, the normalized waiting time to the next
+        event '''
+        i = self._ie
+        if i == self.size:
+            self._refill_exp()
+            i = 0
+        self._ie = i + 1
+        return self._exp[i]
+
+class _F64Heap(object):
+    '''
+    Array-backed binary min-heap of (time, id) pairs held in two parallel
+    NumPy arrays. Replaces heapq over (float, id) tuples in the loop: no
+    tuple is allocated per push and ordering is a pure float comparison,
+    with no fallback on the second element for equal times.
+    '''
+    def __init__(self, cap=1024):
+        self.times = np.empty(cap)
+        self.ids = np.empty(cap, dtype=np.int64)
+        self.n = 0
+    def __len__(self):
+        return self.n
+    def push(self, t, i):
+        n = self.n
+        if n == len(self.times):
+            self.times = np.resize(self.times, 2 * n)
+            self.ids = np.resize(self.ids, 2 * n)
+        self.times[n] = t
+        self.ids[n] = i
+        self.n = n + 1
+        self._up(n)
+    def push_many(self, ts, i):
+        ''' pushes every time in the array ts with the same id '''
+        k = len(ts)
+        n = self.n
+        while n + k > len(self.times):
+            self.times = np.resize(self.times, 2 * len(self.times))
+            self.ids = np.resize(self.ids, 2 * len(self.ids))
+        self.times[n:n + k] = ts
+        self.ids[n:n + k] = i
+        self.n = n + k
+        if k > n:
+            # bottom-up heapify is O(n + k), cheaper than k sift-ups when
+            # the batch dominates the heap
+            for pos in xrange((self.n >> 1) - 1, -1, -1):
+                self._down(pos)
+        else:
+            for pos in xrange(n, n + k):
+                self._up(pos)
+    def pop(self):
+        n = self.n - 1
+        t, i = self.times[0], self.ids[0]
+        self.times[0] = self.times[n]
+        self.ids[0] = self.ids[n]
+        self.n = n
+        if n:
+            self._down(0)
+        return float(t), int(i)
+    def _up(self, pos):
+        times, ids = self.times, self.ids
+        t, i = times[pos], ids[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if times[parent] <= t:
+                break
+            times[pos] = times[parent]
+            ids[pos] = ids[parent]
+            pos = parent
+        times[pos] = t
+        ids[pos] = i
+    def _down(self, pos):
+        times, ids, n = self.times, self.ids, self.n
+        t, i = times[pos], ids[pos]
+        child = 2 * pos + 1
+        while child < n:
+            right = child + 1
+            if right < n and times[right] < times[child]:
+                child = right
+            if times[child] >= t:
+                break
+            times[pos] = times[child]
+            ids[pos] = ids[child]
+            pos = child
+            child = 2 * pos + 1
+        times[pos] = t
+        ids[pos] = i
+
+class _UserArrays(object):
+    '''
+    Structure-of-arrays storage for the users of the python loop. All user
+    attributes live in dense parallel NumPy arrays: alive users always occupy
+    indices [0, n), and removal swaps the last user into the hole. The idx
+    dictionary maps user id to current index, so queued edit tasks resolve
+    their user in O(1) instead of the O(N) users.index() scan. Activation and
+    stopping weights live in Fenwick trees, so both sampling and the rate
+    bookkeeping cost O(log N) per event.
+    '''
+    _fields = [ 'edits', 'successes', 'opinion', 'daily_sessions',
+            'hourly_edits', 'session_edits' ]
+    def __init__(self, users, p1, p2):
+        n = len(users)
+        cap = max(2 * n, 64)
+        for f in self._fields:
+            setattr(self, f, np.zeros(cap))
+        self.ids = np.zeros(cap, dtype=int)
+        for i, u in enumerate(users):
+            self.edits[i] = u.edits
+            self.successes[i] = u.successes
+            self.opinion[i] = u.opinion
+            self.daily_sessions[i] = u.daily_sessions
+            self.hourly_edits[i] = u.hourly_edits
+            self.session_edits[i] = u.session_edits
+            self.ids[i] = u.id
+        self.n = n
+        self.idx = dict(zip(self.ids[:n].tolist(), range(n)))
+        self.next_id = int(self.ids[:n].max()) + 1 if n else 0
+        # entry instances, recycled by rebuild() for the users that survive
+        self.objs = dict(zip(self.ids[:n].tolist(), users))
+        # stopping probabilities for the whole population in one shot
+        r = self.successes[:n] / self.edits[:n] if n else np.zeros(0)
+        self.stop = FenwickCDF(r * p1 + (1 - r) * p2)
+        self.activ = FenwickCDF(self.daily_sessions[:n])
+    @classmethod
+    def create(cls, opinions, args):
+        '''
+        vectorized construction of a fresh population, one user per opinion,
+        without instantiating User objects: a handful of array fills replace
+        num_users constructor calls
+        '''
+        self = cls.__new__(cls)
+        n = len(opinions)
+        cap = max(2 * n, 64)
+        for f in cls._fields:
+            setattr(self, f, np.zeros(cap))
+        self.edits[:n] = args.const_succ
+        self.successes[:n] = args.const_succ
+        self.opinion[:n] = opinions
+        self.daily_sessions[:n] = args.daily_sessions
+        self.hourly_edits[:n] = args.hourly_edits
+        self.session_edits[:n] = args.session_edits
+        self.ids = np.zeros(cap, dtype=int)
+        self.ids[:n] = np.arange(n)
+        self.n = n
+        self.idx = dict(zip(range(n), range(n)))
+        self.next_id = n
+        self.objs = {}
+        # a fresh user has ratio 1 (successes == edits)
+        self.stop = FenwickCDF(np.repeat(args.p_stop_long, n))
+        self.activ = FenwickCDF(self.daily_sessions[:n])
+        return self
+    def _grow(self):
+        cap = 2 * len(self.ids)
+        for f in self._fields + ['ids']:
+            old = getattr(self, f)
+            new = np.zeros(cap, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, f, new)
+    def add(self, edits, successes, opinion, daily_sessions, hourly_edits,
+            session_edits, pstop):
+        if self.n == len(self.ids):
+            self._grow()
+        i = self.n
+        self.edits[i] = edits
+        self.successes[i] = successes
+        self.opinion[i] = opinion
+        self.daily_sessions[i] = daily_sessions
+        self.hourly_edits[i] = hourly_edits
+        self.session_edits[i] = session_edits
+        self.activ.append(daily_sessions)
+        self.stop.append(pstop)
+        self.ids[i] = self.next_id
+        self.idx[self.next_id] = i
+        self.next_id += 1
+        self.n += 1
+        return i
+    def remove(self, i):
+        ''' swap-remove: the last user fills the hole, all arrays in
+        lockstep '''
+        del self.idx[int(self.ids[i])]
+        last = self.n - 1
+        if i != last:
+            for f in self._fields:
+                a = getattr(self, f)
+                a[i] = a[last]
+            self.ids[i] = self.ids[last]
+            self.idx[int(self.ids[i])] = i
+            self.activ.set(i, self.activ.values[last])
+            self.stop.set(i, self.stop.values[last])
+        self.activ.pop()
+        self.stop.pop()
+        self.n = last
+    def rebuild(self):
+        ''' reconstructs User instances for the caller, preserving ids;
+        instances passed in at entry are recycled rather than reallocated '''
+        out = []
+        for i in range(self.n):
+            uid = int(self.ids[i])
+            u = self.objs.get(uid)
+            if u is None:
+                u = User(self.edits[i], self.successes[i], self.opinion[i],
+                        self.daily_sessions[i], self.hourly_edits[i],
+                        self.session_edits[i])
+                u.__id__ = uid
+            else:
+                u.edits = self.edits[i]
+                u.successes = self.successes[i]
+                u.opinion = self.opinion[i]
+            out.append(u)
+        return out
+
+class _PageArrays(object):
+    ''' append-only structure-of-arrays storage for the pages of the python
+    loop. The edit counts double as the popularity pmf, as in the original
+    list implementation where the two counters were updated in lockstep; they
+    are kept in a Fenwick tree so sampling a page is O(log N). '''
+    def __init__(self, pages):
+        n = len(pages)
+        cap = max(2 * n, 64)
+        self.opinion = np.zeros(cap)
+        self.ids = np.zeros(cap, dtype=int)
+        for i, p in enumerate(pages):
+            self.opinion[i] = p.opinion
+            self.ids[i] = p.id
+        self.edits = FenwickCDF([ p.edits for p in pages ])
+        self.n = n
+        self.next_id = int(self.ids[:n].max()) + 1 if n else 0
+        # entry instances, recycled by rebuild(); pages are never removed
+        self.objs = list(pages)
+    @classmethod
+    def create(cls, opinions, args):
+        ''' vectorized construction of the initial pages, one per opinion,
+        without instantiating Page objects '''
+        self = cls.__new__(cls)
+        n = len(opinions)
+        cap = max(2 * n, 64)
+        self.opinion = np.zeros(cap)
+        self.opinion[:n] = opinions
+        self.ids = np.zeros(cap, dtype=int)
+        self.ids[:n] = np.arange(n)
+        self.edits = FenwickCDF(np.repeat(float(args.const_pop), n))
+        self.n = n
+        self.next_id = n
+        self.objs = []
+        return self
+    def add(self, edits, opinion):
+        if self.n == len(self.opinion):
+            cap = 2 * len(self.opinion)
+            for f in ['opinion', 'ids']:
+                old = getattr(self, f)
+                new = np.zeros(cap, dtype=old.dtype)
+                new[:len(old)] = old
+                setattr(self, f, new)
+        idx = self.n
+        self.edits.append(edits)
+        self.opinion[idx] = opinion
+        self.ids[idx] = self.next_id
+        self.next_id += 1
+        self.n += 1
+        return idx
+    def rebuild(self):
+        ''' reconstructs Page instances for the caller, preserving ids;
+        instances passed in at entry are recycled rather than reallocated '''
+        out = []
+        for i in range(self.n):
+            if i < len(self.objs):
+                p = self.objs[i]
+                p.edits = self.edits.values[i]
+                p.opinion = self.opinion[i]
+            else:
+                p = Page(self.edits.values[i], self.opinion[i])
+                p.__id__ = int(self.ids[i])
+            out.append(p)
+        return out
+
 def loop(tstart, tstop, args, users, pages, output, prng=np.random):
     ''' continuous time simulation loop '''
     t = tstart # current time
@@ -59,95 +389,84 @@ def loop(tstart, tstop, args, users, pages, output, prng=np.random):
     pR = args.daily_pages
     p1 = args.p_stop_long
     p2 = args.p_stop_short
+    # hoisted like the cdef locals of the cython twin
+    confidence = args.confidence
+    speed = args.speed
+    rollback_prob = args.rollback_prob
     num_events = 0
-    pactiv = [u.daily_sessions for u in users]
-    pstop = [u.ratio * p1 + (1 - u.ratio) * p2 for u in users] 
-    ppage = [p.edits for p in pages] 
-    editsqueue = []
-    if len(users):
-        aR = np.sum(pactiv)
-        dR = np.sum(pstop)
-    else:
-        aR, dR = 0.0, 0.0
+    # callers may pass either lists of User/Page instances or containers
+    # built with _UserArrays.create / _PageArrays.create
+    U = users if isinstance(users, _UserArrays) else _UserArrays(users, p1, p2)
+    P = pages if isinstance(pages, _PageArrays) else _PageArrays(pages)
+    editsqueue = _F64Heap()
+    rng = _RNGCache(prng)
+    info = _InfoBuffer(args.info_file) if args.info_file is not None else None
     while True:
-        R = aR + dR + uR + pR
-        T = (1 - np.log(prng.uniform())) / R # time to next event
+        R = U.activ.total() + U.stop.total() + uR + pR
+        T = rng.next_exp() / R # time to next event
         if t + T > tstop:
             break
-        while len(editsqueue):
-            tt, user = heappop(editsqueue)
-            if tt < t + T:
-                try:
-                    user_idx = users.index(user)
-                except ValueError:
-                    continue # skip tasks of stopped users
-                if len(pages):
-                    page_idx = randwpmf(ppage, prng=prng)
-                    page = pages[page_idx]
-                    # will later re-update it 
-                    dR -= (user.ratio * p1 + (1 - user.ratio) * p2)
-                    user.edits += 1
-                    page.edits += 1
-                    if np.abs(user.opinion - page.opinion) < args.confidence:
-                        user.successes += 1
-                        user.opinion += args.speed * ( page.opinion - user.opinion )
-                        page.opinion += args.speed * ( user.opinion - page.opinion )
-                    elif prng.rand() < args.rollback_prob:
-                        page.opinion += args.speed * ( user.opinion - page.opinion )
-                    # re-compute the probability user stops and update global
-                    # rate
-                    users[user_idx] = user
-                    ups = (user.ratio * p1 + (1 - user.ratio) * p2)
-                    pstop[user_idx] = ups
-                    dR += ups
-                    pages[page_idx] = page
-                    ppage[page_idx] += 1
-                    if output:
-                        print tt, user.id, page.id
-                    num_events += 1
-            else:
-                heappush(editsqueue, (tt, user))
-                break
+        # peeking at the heap top replaces the pop/push-back of the heapq
+        # version
+        while editsqueue.n and editsqueue.times[0] < t + T:
+            # tasks carry the user id; the idx map resolves it in O(1)
+            tt, uid = editsqueue.pop()
+            slot = U.idx.get(uid)
+            if slot is None:
+                continue # skip tasks of stopped users
+            if P.n:
+                page_idx = P.edits.sample(rng.next_u() * P.edits.total())
+                U.edits[slot] += 1
+                P.edits.update(page_idx, 1.0)
+                # branchless opinion update: succ / rb are 0-1 masks, and
+                # on success the page pulls toward the updated user
+                # opinion, as in the branching original
+                du = U.opinion[slot]
+                dp = P.opinion[page_idx]
+                diff = dp - du
+                succ = 1.0 * (abs(diff) < confidence)
+                rb = (1.0 - succ) * (rng.next_u() < rollback_prob)
+                du += speed * diff * succ
+                U.successes[slot] += succ
+                U.opinion[slot] = du
+                P.opinion[page_idx] = dp + speed * (du - dp) * (succ + rb)
+                # re-compute the probability user stops
+                r = U.successes[slot] / U.edits[slot]
+                U.stop.set(slot, r * p1 + (1 - r) * p2)
+                if output:
+                    print tt, U.ids[slot], P.ids[page_idx]
+                num_events += 1
         t = t + T
-        ev = randwpmf([aR, dR, uR, pR], prng=prng)
+        aR = U.activ.total()
+        dR = U.stop.total()
+        ev = int(randwpmf([aR, dR, uR, pR], prng=prng))
         if ev == 0: # edit cascade
-            user_idx = randwpmf(pactiv, prng=prng)
-            user = users[user_idx]
-            heappush(editsqueue, (t, user))
-            num_edits = prng.poisson(user.session_edits)
-            times = (1 - np.log(prng.rand(num_edits))) / user.hourly_edits
-            times = t + (times / 24.0).cumsum()
-            for tt in times:
-                heappush(editsqueue, (tt, user))
+            slot = U.activ.sample(rng.next_u() * aR)
+            uid = int(U.ids[slot])
+            editsqueue.push(t, uid)
+            num_edits = prng.poisson(U.session_edits[slot])
+            times = (1 - np.log(prng.rand(num_edits))) / U.hourly_edits[slot]
+            editsqueue.push_many(t + (times / 24.0).cumsum(), uid)
         elif ev == 1: # user stops
-            user_idx = randwpmf(pstop, prng=prng)
-            user = users[user_idx]
-            aR -= user.daily_sessions
-            dR -= (user.ratio * p1 + (1 - user.ratio) * p2)
-            del user
-            del users[user_idx]
-            del pstop[user_idx]
-            del pactiv[user_idx]
+            slot = U.stop.sample(rng.next_u() * dR)
+            U.remove(slot)
         elif ev == 2: # new user
-            o = prng.uniform()
-            user = User(args.const_succ, args.const_succ, o, 
-                    args.daily_sessions, args.hourly_edits,
-                    args.session_edits)
-            users.append(user)
-            ups = (user.ratio * p1 + (1 - user.ratio) * p2)
-            aR += user.daily_sessions
-            dR += ups
-            pstop.append(ups)
-            pactiv.append(user.daily_sessions)
+            o = rng.next_u()
+            ups = p1 # a fresh user has ratio 1 (successes == edits)
+            U.add(args.const_succ, args.const_succ, o, args.daily_sessions,
+                    args.hourly_edits, args.session_edits, ups)
         else: # new page
-            if len(users):
-                user_idx = prng.randint(0, len(users))
-                user = users[user_idx]
-                page = Page(args.const_pop + 1, user.opinion)
-                pages.append(page)
-                ppage.append(page.edits)
-        if args.info_file is not None:
-            args.info_file.write('%g %g %g\n' % (t, len(users), len(pages)))
+            if U.n:
+                slot = prng.randint(0, U.n)
+                P.add(args.const_pop + 1, U.opinion[slot])
+        if info is not None:
+            info.write(t, U.n, P.n)
+    if info is not None:
+        info.flush()
+    if isinstance(users, list):
+        users[:] = U.rebuild()
+    if isinstance(pages, list):
+        pages[:] = P.rebuild()
     return num_events
 
 def simulate(args):
@@ -163,35 +482,45 @@ def simulate(args):
     prng, users, pages
     '''
     prng = np.random.RandomState(args.seed)
-    # users have a fixed activity rate and an initial number of ``successes''
-    users = [ User(args.const_succ, args.const_succ, o, args.daily_sessions,\
-            args.hourly_edits, args.session_edits) for o in 
-            prng.random_sample(args.num_users) ]
-    # pages have an initial value of popularity.
-    pages = [ Page(args.const_pop,o) for o in prng.random_sample(args.num_pages) ]
+    # prefer the compiled loop whenever the extension is available; --fast is
+    # kept as an explicit request and --no-fast forces the python loop
+    if args.fast is None:
+        args.fast = c_loop is not None
+    elif args.fast and c_loop is None:
+        raise ValueError('--fast requires the cpeers extension')
+    runloop = c_loop if args.fast else loop
+    # users have a fixed activity rate and an initial number of ``successes'',
+    # pages an initial value of popularity. The python loop takes its
+    # array containers directly, skipping num_users + num_pages object
+    # constructions; the cython loop still wants instance lists
+    if args.fast:
+        users = [ User(args.const_succ, args.const_succ, o,
+                args.daily_sessions, args.hourly_edits, args.session_edits)
+                for o in prng.random_sample(args.num_users) ]
+        pages = [ Page(args.const_pop, o)
+                for o in prng.random_sample(args.num_pages) ]
+    else:
+        users = _UserArrays.create(prng.random_sample(args.num_users), args)
+        pages = _PageArrays.create(prng.random_sample(args.num_pages), args)
     if args.transient:
         t_transient_start = time()
-        if args.fast:
-            n_transient = c_loop(0, args.transient, args, users, pages, False, prng)
-        else:
-            n_transient = loop(0, args.transient, args, users, pages, False, prng)
+        n_transient = runloop(0, args.transient, args, users, pages, False, prng)
         t_transient_stop = time()
         t_transient = t_transient_stop - t_transient_start
         if args.verbosity > 0:
             print >> sys.stderr, 'Transient done in %.2gs (%g events/s)'\
                     % (t_transient, n_transient / t_transient)
     t_sim_start = time()
-    if args.fast:
-        n_sim = c_loop(args.transient, args.transient + args.time, args, users, 
-                pages, True, prng)
-    else:
-        n_sim = loop(args.transient, args.transient + args.time, args, users, 
-                pages, True, prng)
+    n_sim = runloop(args.transient, args.transient + args.time, args, users,
+            pages, True, prng)
     t_sim_stop = time()
     t_sim = t_sim_stop - t_sim_start
     if args.verbosity > 0:
         print >> sys.stderr, 'Simulation done in %.2gs (%g events/s)'\
                 % (t_sim, n_sim / t_sim)
+    if not args.fast:
+        users = users.rebuild()
+        pages = pages.rebuild()
     return prng, users, pages
 
 class Arguments(object):
@@ -240,33 +569,35 @@ class Arguments(object):
             warn('turning off opinion update', category=UserWarning)
     def __str__(self):
         h,w = ttysize() or (50, 85)
-        sio = StringIO()
-        print >> sio, '-'*w
-        print >> sio, 'TIME.\tSimulation: %g (days).\tTransient: %g (days).'\
-                % (self.time, self.transient)
-        print >> sio, 'USERS.\tInitial: %d (users).\tIn-rate: %g (users/day).' % (
-                self.num_users, self.daily_users)
-        print >> sio, '\tLong life: %g (days)\tShort life: %g (days)'\
-                % (self.long_life, self.short_life)
-        print >> sio, 'EDITS.\tSessions/Day: %g.\tEdits/Hour: %g.'\
-                '\tEdits/Session: %d.' % (self.daily_sessions,
-                        self.hourly_edits, self.session_edits)
-        print >> sio, 'PAGES.\tInitial: %d (pages).\tIn-rate: %g (pages/day).' % (
-                self.num_pages, self.daily_pages)
-        print >> sio, 'PAIRS.\tBase success: %g.\tBase popularity: %g.'\
-                % (self.const_succ, self.const_pop)
-        print >> sio, 'EDITS.\tConfidence: %g.\tSpeed: %g.\t\tRollback-prob.: %g.'\
-                % (self.confidence, self.speed, self.rollback_prob)
-        print >> sio, 'MISC.\tSeed: %s\t\tInfo file: %s.' % (self.seed,
-                 self.info_file.name if self.info_file else 'None')
-        try:
-            import sys
-            sys.stderr = sio
+        lines = [
+            '-'*w,
+            'TIME.\tSimulation: %g (days).\tTransient: %g (days).'\
+                    % (self.time, self.transient),
+            'USERS.\tInitial: %d (users).\tIn-rate: %g (users/day).' % (
+                    self.num_users, self.daily_users),
+            '\tLong life: %g (days)\tShort life: %g (days)'\
+                    % (self.long_life, self.short_life),
+            'EDITS.\tSessions/Day: %g.\tEdits/Hour: %g.'\
+                    '\tEdits/Session: %d.' % (self.daily_sessions,
+                            self.hourly_edits, self.session_edits),
+            'PAGES.\tInitial: %d (pages).\tIn-rate: %g (pages/day).' % (
+                    self.num_pages, self.daily_pages),
+            'PAIRS.\tBase success: %g.\tBase popularity: %g.'\
+                    % (self.const_succ, self.const_pop),
+            'EDITS.\tConfidence: %g.\tSpeed: %g.\t\tRollback-prob.: %g.'\
+                    % (self.confidence, self.speed, self.rollback_prob),
+            'MISC.\tSeed: %s\t\tInfo file: %s.' % (self.seed,
+                    self.info_file.name if self.info_file else 'None'),
+        ]
+        # collect the warnings explicitly instead of rebinding sys.stderr,
+        # which was not thread-safe and relied on the warning printer
+        with catch_warnings(record=True) as ws:
+            simplefilter('always')
             self._warn()
-        finally:
-            sys.stderr = sys.__stderr__
-        print >> sio, '-'*w,
-        return sio.getvalue()
+        for wi in ws:
+            lines.append('%s: %s' % (wi.category.__name__, wi.message))
+        lines.append('-'*w)
+        return '\n'.join(lines)
 
 def make_parser(): 
     parser = ArgumentParser(description=__doc__, fromfile_prefix_chars='@')
@@ -322,8 +653,10 @@ def make_parser():
     parser.add_argument('-i', '--info', type=FileType('w'), help='write '
             'simulation information to %(metavar)s', metavar='FILE',
             dest='info_file')
-    parser.add_argument('--fast', action='store_true', help='Use Cython '
-            'implementation')
+    parser.add_argument('--fast', action='store_true', default=None,
+            help='Use Cython implementation (default: if available)')
+    parser.add_argument('--no-fast', action='store_false', dest='fast',
+            help='force the pure Python implementation')
 # profiling
     parser.add_argument('--profile', action='store_true', help='run profiling')
     parser.add_argument('--profile-file', metavar='FILE', default=None,
@@ -0,0 +1,33 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose import SkipTest
+from peers.design import lhd
+
+def _check_design(design, m, n):
+    ''' a valid LHD: one permutation of the grid indices per dimension '''
+    design = np.asarray(design)
+    assert design.shape == (m, n)
+    for row in design:
+        assert sorted(row) == list(range(n)), row
+
+def test_lhd():
+    prng = np.random.RandomState(0)
+    d, design = lhd.lhd(3, 8, prng=prng)
+    _check_design(design, 3, 8)
+    assert_allclose(d, np.sqrt(lhd.min_sq_pdist(design)), rtol=1e-6)
+
+def test_maximin():
+    prng = np.random.RandomState(1)
+    d, design = lhd.lhd(3, 8, num=40, maximin=True, prng=prng)
+    _check_design(design, 3, 8)
+    assert_allclose(d, np.sqrt(lhd.min_sq_pdist(design)), rtol=1e-6)
+
+def test_lhd_core():
+    ''' the C search returns valid designs with the right score '''
+    if lhd._lhd_core is None:
+        raise SkipTest
+    prng = np.random.RandomState(2)
+    d, design = lhd._lhd_core.maximin_lhd(3, 10, 25, prng)
+    _check_design(design, 3, 10)
+    assert_allclose(d, np.sqrt(lhd.min_sq_pdist(np.asarray(design))),
+            rtol=1e-6)
@@ -0,0 +1,46 @@
+import heapq
+import numpy as np
+from peers.peers import _F64Heap
+
+def test_pop_order():
+    ''' pops come out in the same order as heapq on (time, id) tuples '''
+    prng = np.random.RandomState(0)
+    times = prng.rand(500)
+    h = _F64Heap()
+    ref = []
+    for i in xrange(len(times)):
+        h.push(times[i], i)
+        heapq.heappush(ref, (times[i], i))
+    got = [ h.pop() for i in xrange(len(times)) ]
+    expected = [ heapq.heappop(ref) for i in xrange(len(times)) ]
+    assert got == expected
+
+def test_interleaved():
+    ''' interleaved pushes and pops agree with heapq '''
+    prng = np.random.RandomState(1)
+    h = _F64Heap()
+    ref = []
+    for i in xrange(200):
+        t = prng.rand()
+        h.push(t, i)
+        heapq.heappush(ref, (t, i))
+        if i % 3 == 0:
+            assert h.pop() == heapq.heappop(ref)
+    while ref:
+        assert h.pop() == heapq.heappop(ref)
+
+def test_push_many():
+    ''' bulk pushes of a session's edit times agree with one-by-one pushes '''
+    prng = np.random.RandomState(2)
+    h = _F64Heap()
+    ref = []
+    for r in xrange(20):
+        ts = np.sort(prng.rand(prng.randint(1, 30))) + r
+        h.push_many(ts, r)
+        for t in ts:
+            heapq.heappush(ref, (t, r))
+        # drain a few in between, so bulk pushes also hit non-empty heaps
+        for j in xrange(3):
+            assert h.pop() == heapq.heappop(ref)
+    while ref:
+        assert h.pop() == heapq.heappop(ref)
@@ -0,0 +1,33 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose import SkipTest
+from warnings import warn
+
+try:
+    from peers.fit.truncated import _nll_and_grad
+except ImportError:
+    warn('cannot import peers.fit.truncated; please install its dependencies',
+            category=UserWarning)
+    _nll_and_grad = None
+
+def test_gradient():
+    ''' the analytic gradient of EM_lbfgs vs central finite differences '''
+    if _nll_and_grad is None:
+        raise SkipTest
+    prng = np.random.RandomState(0)
+    data = np.r_[prng.randn(200), prng.randn(100) * .5 + 2]
+    bound = (data.min(), data.max())
+    k = 2
+    # theta stacks (eta, mu, log sigma); pick a point away from the optimum
+    theta = np.concatenate((np.log([.6, .4]), [-.5, 1.5], np.log([1.2, .7])))
+    nll, grad = _nll_and_grad(theta, data, k, bound)
+    assert np.isfinite(nll)
+    eps = 1e-6
+    num = np.empty_like(theta)
+    for i in range(len(theta)):
+        dt = np.zeros_like(theta)
+        dt[i] = eps
+        fp = _nll_and_grad(theta + dt, data, k, bound)[0]
+        fm = _nll_and_grad(theta - dt, data, k, bound)[0]
+        num[i] = (fp - fm) / (2 * eps)
+    assert_allclose(grad, num, rtol=1e-5, atol=1e-6)
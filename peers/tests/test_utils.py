@@ -0,0 +1,45 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from peers.utils import FenwickCDF
+
+def _check_against_cumsum(f, prng, draws=500):
+    ''' sample must agree with searchsorted on the plain cumulative sum '''
+    w = f.values[:len(f)]
+    assert_allclose(f.total(), w.sum())
+    cum = w.cumsum()
+    for u in prng.rand(draws) * w.sum():
+        assert f.sample(u) == np.searchsorted(cum, u, side='left'), u
+
+def test_sample():
+    prng = np.random.RandomState(0)
+    f = FenwickCDF(prng.rand(37) * 5)
+    assert len(f) == 37
+    _check_against_cumsum(f, prng)
+
+def test_update():
+    prng = np.random.RandomState(1)
+    f = FenwickCDF(prng.rand(20))
+    f.update(5, 2.5)
+    f.set(13, 0.1)
+    f.set(0, 0.0)
+    _check_against_cumsum(f, prng)
+
+def test_append_pop():
+    prng = np.random.RandomState(2)
+    f = FenwickCDF(prng.rand(3))
+    # grow past several capacity doublings
+    for x in prng.rand(100):
+        f.append(x)
+    assert len(f) == 103
+    _check_against_cumsum(f, prng)
+    for i in xrange(50):
+        f.pop()
+    assert len(f) == 53
+    _check_against_cumsum(f, prng)
+
+def test_empty():
+    f = FenwickCDF()
+    assert len(f) == 0
+    assert f.total() == 0.0
+    f.append(1.0)
+    assert f.sample(0.5) == 0
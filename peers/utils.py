@@ -5,10 +5,17 @@ import re
 import os.path
 import numpy as np
 from subprocess import Popen, PIPE
-from scikits.learn.gaussian_process import GaussianProcess
+from multiprocessing import Pool, cpu_count
 
 from .actions import *
 
+try:
+    # pandas' C parser reads large text files several times faster than
+    # numpy.loadtxt, but it is an optional dependency
+    import pandas as _pandas
+except ImportError:
+    _pandas = None
+
 _sanetext_pat = re.compile(r'([^\\])_')
 _sanetext_repl = r'\1\_'
 
@@ -32,12 +39,10 @@ def ttysize():
     except OSError:
         pass
 
-_IDS = {}
-
 class IncIDMixin(object):
     '''
     Mixin for classes with incrementally identified instances
-    
+
     Notes
     -----
     * Classes and their subclasses DO NOT share the id counter.
@@ -47,17 +52,97 @@ class IncIDMixin(object):
     __slots__ = ['__id__']
     def __new__(cls, *args, **kwargs):
         self = super(IncIDMixin, cls).__new__(cls)
-        self.__id__ = _IDS.get(cls, 0)
-        _IDS[cls] = self.__id__ + 1
+        # the counter lives on each concrete class; looking it up through
+        # __dict__ rather than plain attribute access keeps subclasses from
+        # inheriting the count of their parent
+        nid = cls.__dict__.get('_next_id', 0)
+        self.__id__ = nid
+        cls._next_id = nid + 1
         return self
     @property
     def id(self):
         return self.__id__
 
-def gettxtdata(fn, responses, delimiter=',', with_errors=False, **kwargs):
+class FenwickCDF(object):
+    '''
+    Fenwick (binary indexed) tree over a sequence of non-negative weights.
+    Point updates, the total weight and sampling an index with probability
+    proportional to its weight all cost O(log N), replacing the O(N)
+    cumulative sum that randwpmf recomputes at every call.
+    '''
+    def __init__(self, weights=None):
+        if weights is None:
+            weights = []
+        w = np.asarray(weights, dtype=np.double)
+        n = len(w)
+        cap = 1
+        while cap < n:
+            cap *= 2
+        values = np.zeros(cap)
+        values[:n] = w
+        self._rebuild(values, n)
+    def _rebuild(self, values, n):
+        cap = len(values)
+        tree = np.zeros(cap + 1)
+        tree[1:] = values
+        for i in xrange(1, cap):
+            j = i + (i & -i)
+            if j <= cap:
+                tree[j] += tree[i]
+        self.values = values
+        self.tree = tree
+        self.cap = cap
+        self.n = n
+    def __len__(self):
+        return self.n
+    def update(self, i, delta):
+        ''' adds delta to the i-th weight '''
+        self.values[i] += delta
+        i += 1
+        while i <= self.cap:
+            self.tree[i] += delta
+            i += i & -i
+    def set(self, i, w):
+        ''' sets the i-th weight to w '''
+        self.update(i, w - self.values[i])
+    def append(self, w):
+        if self.n == self.cap:
+            values = np.zeros(2 * self.cap)
+            values[:self.n] = self.values
+            self._rebuild(values, self.n)
+        self.n += 1
+        self.set(self.n - 1, w)
+    def pop(self):
+        ''' removes the last weight '''
+        self.n -= 1
+        self.set(self.n, 0.0)
+    def total(self):
+        s, i = 0.0, self.n
+        while i:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+    def sample(self, u):
+        '''
+        Returns the smallest index whose cumulative weight exceeds u, i.e. a
+        sample from the pmf of the weights when u is uniform on [0, total()).
+        '''
+        pos, k = 0, self.cap
+        while k:
+            nxt = pos + k
+            if nxt <= self.cap and self.tree[nxt] < u:
+                u -= self.tree[nxt]
+                pos = nxt
+            k >>= 1
+        if pos >= self.n:
+            pos = self.n - 1
+        return pos
+
+def gettxtdata(fn, responses, delimiter=',', with_errors=False, usecols=None,
+        **kwargs):
     '''
     Opens a text data file and read data, separating them between
-    input variables X and responses Y. 
+    input variables X and responses Y.
 
     Parameters
     ----------
@@ -65,11 +150,18 @@ def gettxtdata(fn, responses, delimiter=',', with_errors=False, **kwargs):
     responses   - number of response variables
     with_errors - if True, each response variable is followed by its standard
                   errors (returns X,Y,Ye)
+    usecols     - sequence of column indices to read; the other columns are
+                  not parsed at all
 
-    Additional keyword arguments are passed to numpy.loadtxt.
+    Additional keyword arguments are passed to numpy.loadtxt. When pandas is
+    installed and no such arguments are given, the file is parsed with
+    pandas.read_csv instead, which is considerably faster on large files.
     '''
-    kwargs['delimiter'] = delimiter
-    data = np.loadtxt(fn, **kwargs)
+    if _pandas is not None and not kwargs:
+        data = _pandas.read_csv(fn, sep=delimiter, header=None,
+                dtype=np.double, usecols=usecols).values
+    else:
+        data = np.loadtxt(fn, delimiter=delimiter, usecols=usecols, **kwargs)
     if with_errors:
         M = responses * 2
         X = data[:,:-M]
@@ -110,10 +202,13 @@ def rect(x, horizontal=True):
     if x == 2:
         h, w = (1,2)
     else:
-        allrows, = np.where(np.mod(x, np.arange(1,x+1)))
-        allcols = np.asarray(np.ceil(float(x) / allrows), dtype=int)
-        i = np.argmin(np.abs(allrows - allcols))
-        h, w = allrows[i], allcols[i]
+        # the optimal height is near sqrt(x), so a bounded loop suffices and
+        # no O(x) temporary array is allocated
+        h, w = 1, x
+        for m in xrange(2, int(x ** 0.5) + 2):
+            n = -(-x // m) # ceiling division
+            if abs(m - n) < abs(h - w):
+                h, w = m, n
     if horizontal:
         if w >= h:
             return w, h
@@ -125,6 +220,20 @@ def rect(x, horizontal=True):
         else:
             return w, h
 
+def _fitgpworker(args):
+    ''' fits one gaussian process (pool worker) '''
+    # deferred so that importing this module does not require scikits.learn
+    from scikits.learn.gaussian_process import GaussianProcess
+    X, y, kwargs = args
+    gp = GaussianProcess(**kwargs)
+    gp.fit(X, y)
+    return gp
+
+def _predictgpworker(args):
+    ''' evaluates one gaussian process (pool worker) '''
+    model, X, kwargs = args
+    return model.predict(X, **kwargs)
+
 class SurrogateModel(object):
     '''
     A class that evaluates a gaussian model independently for each response
@@ -135,24 +244,54 @@ class SurrogateModel(object):
     @property
     def models(self):
         return list(self._models)
-    def __call__(self, X, **kwargs):
+    def __call__(self, X, nprocs=None, **kwargs):
         '''
         Calls GaussianProcess.predict on each of the GP models of the instance.
-        Additional keyword arguments are passed to it. 
+        The models are independent, so with nprocs > 1 (default: all cores)
+        they are evaluated on a pool of worker processes. Additional keyword
+        arguments are passed to GaussianProcess.predict.
         '''
-        Y = [ m.predict(X, **kwargs) for m in self._models ]
+        if nprocs is None:
+            nprocs = cpu_count()
+        nprocs = min(nprocs, len(self._models))
+        if nprocs > 1:
+            pool = Pool(nprocs)
+            try:
+                Y = pool.map(_predictgpworker,
+                        [ (m, X, kwargs) for m in self._models ])
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            Y = [ m.predict(X, **kwargs) for m in self._models ]
         return np.row_stack(Y).T
     @classmethod
-    def fitGP(cls, X, Y, **kwargs):
+    def fitGP(cls, X, Y, nprocs=None, **kwargs):
         '''
         Fits a gaussian process of X to each variable in Y and returns a
-        SurrogateModel instance
+        SurrogateModel instance. The fits are independent, so with nprocs > 1
+        (default: all cores) each column of Y goes to a worker process.
+        Additional keyword arguments are passed to GaussianProcess.
         '''
-        models = []
-        for y in Y.T:
-            gp = GaussianProcess(**kwargs)
-            gp.fit(X, y)
-            models.append(gp)
+        cols = list(Y.T)
+        if nprocs is None:
+            nprocs = cpu_count()
+        nprocs = min(nprocs, len(cols))
+        if nprocs > 1:
+            pool = Pool(nprocs)
+            try:
+                models = pool.map(_fitgpworker,
+                        [ (X, y, kwargs) for y in cols ])
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            from scikits.learn.gaussian_process import GaussianProcess
+            models = []
+            for y in cols:
+                gp = GaussianProcess(**kwargs)
+                gp.fit(X, y)
+                models.append(gp)
         return cls(models)
     def __repr__(self):
         return '<SurrogateModel of %s>' % repr(self.models)
@@ -21,6 +21,8 @@ setup(
         ext_modules = [
             Extension("peers.rand", ["peers/rand.c"], include_dirs=_I), 
             Extension("peers.cpeers", ["peers/cpeers.c"], include_dirs=_I),
+            Extension("peers.design._lhd_core", ["peers/design/_lhd_core.c"],
+                include_dirs=_I),
             Extension("peers.fit.ctruncated",
                 [
                     "peers/fit/ctruncated.c", 
@@ -17,6 +17,8 @@ if __name__ == '__main__':
             ext_modules = [
                 Extension("peers.rand", ["peers/rand.pyx"], include_dirs=_I), 
                 Extension("peers.cpeers", ["peers/cpeers.pyx"], include_dirs=_I),
+                Extension("peers.design._lhd_core",
+                    ["peers/design/_lhd_core.pyx"], include_dirs=_I),
                 Extension("peers.fit.ctruncated",
                     [
                         "peers/fit/ctruncated.pyx", 